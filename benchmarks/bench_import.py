@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import click
+import statistics
+import subprocess
+import sys
+
+
+def import_time_us(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    # The last line is the top-level import, with cumulative time.
+    last = result.stderr.strip().splitlines()[-1]
+    return int(last.split("|")[1])
+
+
+@click.command()
+@click.option("--module", default="fixtodict.cli", help="Module to import.")
+@click.option("--runs", default=10, help="Number of fresh interpreters.")
+@click.option(
+    "--max-ms",
+    default=None,
+    type=float,
+    help="Fail if the median import time exceeds this budget.",
+)
+def main(module, runs, max_ms):
+    """
+    Measure the import time of FIXtodict via `python -X importtime`.
+    """
+    times = [import_time_us(module) / 1000 for _ in range(runs)]
+    median = statistics.median(times)
+    print("-- import {} ({} runs)".format(module, runs))
+    print("Min:    {:>8.1f}ms".format(min(times)))
+    print("Median: {:>8.1f}ms".format(median))
+    if max_ms is not None and median > max_ms:
+        print("Error: over budget of {:.1f}ms.".format(max_ms))
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
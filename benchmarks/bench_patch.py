@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import click
+import copy
+import time
+import jsonpatch
+
+from fixtodict.patch import apply_patch, apply_patches
+
+
+def synthetic_repository(fields):
+    version = {"fix": "fix", "major": "5", "minor": "0", "sp": "2"}
+    return {
+        "meta": {"schema": "1", "version": dict(version, ep=[])},
+        "abbreviations": {},
+        "datatypes": {},
+        "sections": {},
+        "categories": {},
+        "components": {},
+        "fields": {
+            str(tag): {
+                "name": "Field{}".format(tag),
+                "datatype": "String",
+                "docs": {"description": "Field number {}.".format(tag)},
+                "history": {"added": version},
+            }
+            for tag in range(1, fields + 1)
+        },
+        "messages": {},
+    }
+
+
+def synthetic_ep(ep, fields, updates):
+    ops = []
+    for i in range(updates):
+        tag = (ep * updates + i) % fields + 1
+        ops.append(
+            {
+                "op": "replace",
+                "path": "/fields/{}/name".format(tag),
+                "value": "Field{}EP{}".format(tag, ep),
+            }
+        )
+        ops.append(
+            {
+                "op": "replace",
+                "path": "/fields/{}/docs".format(tag),
+                "value": {"description": "Updated by EP{}.".format(ep)},
+            }
+        )
+    ops.append({"op": "add", "path": "/fields/{}".format(fields + ep + 1), "value": {}})
+    ops.append({"op": "add", "path": "/meta/version/ep/-", "value": str(ep)})
+    return jsonpatch.JsonPatch(ops)
+
+
+@click.command()
+@click.option("--fields", default=5000, help="Number of fields.")
+@click.option("--eps", default=50, help="Number of Extension Packs.")
+@click.option("--updates", default=100, help="Updated fields per EP.")
+def main(fields, eps, updates):
+    """
+    Compare `apply_patch`, one EP at a time, against `apply_patches`.
+    """
+    data = synthetic_repository(fields)
+    patches = [synthetic_ep(ep, fields, updates) for ep in range(eps)]
+
+    old = copy.deepcopy(data)
+    start = time.perf_counter()
+    for patch in patches:
+        old = apply_patch(old, patch)
+    elapsed_old = time.perf_counter() - start
+
+    new = copy.deepcopy(data)
+    start = time.perf_counter()
+    new = apply_patches(new, patches)
+    elapsed_new = time.perf_counter() - start
+
+    assert old == new
+    ops = sum(len(p.patch) for p in patches)
+    print("-- {} EPs, {} ops, {} fields".format(eps, ops, fields))
+    print("apply_patch (one by one): {:>8.3f}s".format(elapsed_old))
+    print("apply_patches (batched):  {:>8.3f}s".format(elapsed_new))
+    print("Speedup:                  {:>8.1f}x".format(elapsed_old / elapsed_new))
+
+
+if __name__ == "__main__":
+    main()
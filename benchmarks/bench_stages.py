@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+import click
+import copy
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import PRESETS, SyntheticRepository
+from fixtodict.basic_repository_v1 import (
+    BASIC_REPOSITORY_V1_FILES,
+    embed_basic_repository_v1,
+)
+from fixtodict.cli.repo import build_basic_repository
+from fixtodict.cli.utils.json import DEFAULT_INDENT
+from fixtodict.cli.utils.xml import read_xml_root
+from fixtodict.extension_pack import ExtensionPack
+from fixtodict.fix_version import FixVersion
+from fixtodict.patch import apply_patch
+from fixtodict.unified_repository_v1 import transform_unified_repository_v1
+from fixtodict.schema import validate_v1
+from fixtodict.xml_logic.utils import get_fuzzy
+
+
+class Stage:
+    def __init__(self, name, records, f, make_args=tuple):
+        self.name = name
+        self.records = records
+        self.f = f
+        # Stages might modify their arguments, so each run gets fresh ones.
+        self.make_args = make_args
+
+    def run(self, repeat):
+        best = None
+        for _ in range(repeat):
+            args = self.make_args()
+            start = time.perf_counter()
+            result = self.f(*args)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        # Memory is measured on a separate run, as tracing slows things down.
+        args = self.make_args()
+        tracemalloc.start()
+        self.f(*args)
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return (result, {"seconds": best, "peak": peak, "records": self.records})
+
+
+def entries(data):
+    kinds = ["abbreviations", "datatypes", "sections", "categories"]
+    kinds += ["fields", "components", "messages"]
+    return sum(len(data[kind]) for kind in kinds)
+
+
+@click.command()
+@click.option(
+    "--preset",
+    type=click.Choice(sorted(PRESETS)),
+    default="fix-4-4",
+    help="Size of the synthetic repositories.",
+)
+@click.option("--fields", type=int, help="Override the number of fields.")
+@click.option("--enums-per-field", type=int, help="Override enums per field.")
+@click.option("--components", type=int, help="Override the number of components.")
+@click.option("--messages", type=int, help="Override the number of messages.")
+@click.option("--contents", type=int, help="Override msg-contents per parent.")
+@click.option(
+    "--src",
+    type=click.Path(exists=True, file_okay=False),
+    help='Benchmark this "Basic" repository instead of a synthetic one.',
+)
+@click.option("--repeat", default=3, help="Timed runs per stage (best is kept).")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare results against this baseline.",
+)
+@click.option(
+    "--save-baseline",
+    type=click.Path(dir_okay=False),
+    help="Save results as a baseline to this file.",
+)
+@click.option(
+    "--max-slowdown",
+    type=float,
+    help="Fail if any stage is this many times slower than the baseline.",
+)
+def main(preset, src, repeat, baseline, save_baseline, max_slowdown, **sizes):
+    """
+    Time each stage of the FIXtodict pipeline over synthetic (or real) FIX
+    Repository data, reporting throughput and peak memory.
+    """
+    params = dict(PRESETS[preset])
+    params.update({k: v for (k, v) in sizes.items() if v is not None})
+    synthetic = SyntheticRepository(**params)
+    tmp = tempfile.TemporaryDirectory()
+    if src is None:
+        src = os.path.join(tmp.name, "basic")
+        synthetic.write_basic(src)
+    unified_path = os.path.join(tmp.name, "unified.xml")
+    phrases_path = os.path.join(tmp.name, "phrases.xml")
+    synthetic.write_unified(unified_path, phrases_path)
+    ep_path = os.path.join(tmp.name, "ep.xml")
+    synthetic.write_ep(ep_path, 254, updates=max(1, params["fields"] // 20))
+
+    results = {}
+    baseline_results = {}
+    if baseline:
+        with open(baseline) as f:
+            stored = json.load(f)
+        if stored["params"] != params:
+            print("-- Warning: baseline was run with {}".format(stored["params"]))
+        baseline_results = stored["results"]
+
+    def run(stage):
+        (result, results[stage.name]) = stage.run(repeat)
+        report(stage.name, results[stage.name], baseline_results.get(stage.name))
+        return result
+
+    print("-- {}".format(params))
+    print(
+        "{:<40} {:>9} {:>12} {:>10} {:>9}".format(
+            "Stage", "Time (s)", "Records/s", "Peak (MB)", "Baseline"
+        )
+    )
+    # "Basic" repository, stage by stage.
+    roots = {}
+    converted = {}
+    for (kind, filename, xml_to_dict, opt) in BASIC_REPOSITORY_V1_FILES:
+        if not os.path.isfile(os.path.join(src, filename)):
+            continue
+        records = len(read_xml_root(src, filename))
+        roots[kind] = run(
+            Stage(
+                "read_xml_root[{}]".format(filename),
+                records,
+                read_xml_root,
+                lambda filename=filename: (src, filename),
+            )
+        )
+        converted[kind] = run(
+            Stage(
+                xml_to_dict.__name__,
+                records,
+                xml_to_dict,
+                lambda kind=kind: (roots[kind],),
+            )
+        )
+    fix_version = FixVersion(get_fuzzy(roots["messages"], "version")).data
+    run(
+        Stage(
+            "embed_basic_repository_v1",
+            sum(len(v) for v in converted.values()),
+            lambda converted: embed_basic_repository_v1(fix_version, **converted),
+            lambda: (copy.deepcopy(converted),),
+        )
+    )
+    data = run(
+        Stage("build_basic_repository", 1, build_basic_repository, lambda: (src,))
+    )
+    # "Unified" repository.
+    run(
+        Stage(
+            "transform_unified_repository_v1",
+            synthetic.fields,
+            transform_unified_repository_v1,
+            lambda: (
+                read_xml_root("", unified_path)[0],
+                read_xml_root("", phrases_path),
+            ),
+        )
+    )
+    # Operations on produced data. EP patches append to the list of EPs.
+    data["meta"]["version"].setdefault("ep", [])
+    run(Stage("validate_v1", entries(data), validate_v1, lambda: (data,)))
+    ep_root = read_xml_root("", ep_path)
+    patch = run(
+        Stage(
+            "ExtensionPack.to_jsonpatch",
+            len(ep_root.findall(".//Field")),
+            lambda: ExtensionPack(ep_root).to_jsonpatch(),
+        )
+    )
+    run(Stage("apply_patch", len(patch.patch), apply_patch, lambda: (data, patch)))
+    run(
+        Stage(
+            "json.dumps",
+            entries(data),
+            lambda: json.dumps(data, indent=DEFAULT_INDENT),
+        )
+    )
+    tmp.cleanup()
+
+    if save_baseline:
+        with open(save_baseline, "w") as f:
+            json.dump({"params": params, "results": results}, f, indent=DEFAULT_INDENT)
+        print("-- Written to '{}'".format(save_baseline))
+    if max_slowdown is not None:
+        slow = [
+            name
+            for (name, result) in results.items()
+            if name in baseline_results
+            and result["seconds"] > baseline_results[name]["seconds"] * max_slowdown
+        ]
+        if slow:
+            print("Error: slower than baseline: {}".format(", ".join(slow)))
+            exit(1)
+
+
+def report(name, result, baseline):
+    throughput = result["records"] / result["seconds"] if result["seconds"] else 0
+    comparison = ""
+    if baseline:
+        comparison = "x{:.2f}".format(result["seconds"] / baseline["seconds"])
+    print(
+        "{:<40} {:>9.4f} {:>12.0f} {:>10.1f} {:>9}".format(
+            name, result["seconds"], throughput, result["peak"] / 2 ** 20, comparison
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
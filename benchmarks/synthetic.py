@@ -0,0 +1,348 @@
+"""
+Synthetic FIX Repository data, shaped like the real thing, for benchmarks.
+"""
+
+import os
+from xml.etree.ElementTree import Element, SubElement, ElementTree
+
+VERSION = "FIX.5.0SP2"
+
+# Roughly the size of FIX 5.0 SP2 with a few hundred EPs applied.
+PRESETS = {
+    "tiny": dict(fields=100, enums_per_field=4, components=20, messages=10, contents=5),
+    "fix-4-4": dict(
+        fields=900, enums_per_field=8, components=100, messages=90, contents=12
+    ),
+    "fix-5-0-sp2": dict(
+        fields=5000, enums_per_field=12, components=800, messages=150, contents=15
+    ),
+}
+
+
+class SyntheticRepository:
+    """
+    Describes a repository of the given size. Every fourth field has
+    `enums_per_field` enumerated values; every message and component has
+    `contents` msg-contents, referring to both fields and components.
+    """
+
+    def __init__(self, fields, enums_per_field, components, messages, contents):
+        self.fields = fields
+        self.enums_per_field = enums_per_field
+        self.components = components
+        self.messages = messages
+        self.contents = contents
+
+    def params(self):
+        return dict(
+            fields=self.fields,
+            enums_per_field=self.enums_per_field,
+            components=self.components,
+            messages=self.messages,
+            contents=self.contents,
+        )
+
+    def enum_tags(self):
+        return range(1, self.fields + 1, 4)
+
+    def component_ids(self):
+        return range(1001, 1001 + self.components)
+
+    def msg_types(self):
+        return ["M{}".format(i) for i in range(self.messages)]
+
+    def content_tags(self, parent):
+        # Mostly fields, and a component every now and then.
+        for position in range(1, self.contents + 1):
+            if position % 5 == 0 and self.components > 0:
+                yield ("component", (parent + position) % self.components + 1001)
+            else:
+                yield ("field", (parent * 7 + position) % self.fields + 1)
+
+    def write_basic(self, dst):
+        """
+        Writes "Basic" repository files to the `dst` directory.
+        """
+        os.makedirs(dst, exist_ok=True)
+        files = {
+            "Abbreviations.xml": self.basic_abbreviations(),
+            "Categories.xml": self.basic_categories(),
+            "Components.xml": self.basic_components(),
+            "Datatypes.xml": self.basic_datatypes(),
+            "Enums.xml": self.basic_enums(),
+            "Fields.xml": self.basic_fields(),
+            "Messages.xml": self.basic_messages(),
+            "MsgContents.xml": self.basic_msg_contents(),
+            "Sections.xml": self.basic_sections(),
+        }
+        for (filename, root) in files.items():
+            ElementTree(root).write(os.path.join(dst, filename), encoding="utf-8")
+
+    def basic_root(self, tag):
+        return Element(tag, version=VERSION, edition="2010")
+
+    def basic_abbreviations(self):
+        root = self.basic_root("Abbreviations")
+        for i in range(self.fields // 10):
+            elem = SubElement(root, "Abbreviation", added="FIX.4.4")
+            text(elem, "AbbrTerm", "Abbr{}".format(i))
+            text(elem, "Term", "Abbreviated term {}".format(i))
+            text(elem, "Usage", "Used in field names.")
+        return root
+
+    def basic_categories(self):
+        root = self.basic_root("Categories")
+        for i in range(10):
+            elem = SubElement(root, "Category", added="FIX.4.4")
+            text(elem, "CategoryID", "Category{}".format(i))
+            text(elem, "FIXMLFileName", "category{}".format(i))
+            text(elem, "NotReqXML", "0")
+            text(elem, "GenerateImplFile", "0")
+            text(elem, "ComponentType", "Message")
+            text(elem, "SectionID", "Section{}".format(i % 3))
+        return root
+
+    def basic_sections(self):
+        root = self.basic_root("Sections")
+        for i in range(3):
+            elem = SubElement(root, "Section", added="FIX.4.4")
+            text(elem, "SectionID", "Section{}".format(i))
+            text(elem, "Name", "Section {}".format(i))
+            text(elem, "DisplayOrder", str(i))
+            text(elem, "Volume", str(i + 1))
+            text(elem, "NotReqXML", "0")
+            text(elem, "FIXMLFileName", "section{}".format(i))
+            text(elem, "Description", "Messages of section {}.".format(i))
+        return root
+
+    def basic_datatypes(self):
+        root = self.basic_root("Datatypes")
+        for i in range(20):
+            elem = SubElement(root, "Datatype", added="FIX.4.2")
+            text(elem, "Name", datatype(i))
+            text(elem, "BaseType", "String")
+            text(elem, "Description", "Datatype {}.".format(i))
+            text(elem, "Example", "Example of datatype {}.".format(i))
+        return root
+
+    def basic_fields(self):
+        root = self.basic_root("Fields")
+        for tag in range(1, self.fields + 1):
+            elem = SubElement(root, "Field", **history(tag))
+            text(elem, "Tag", str(tag))
+            text(elem, "Name", "Field{}".format(tag))
+            text(elem, "Type", datatype(tag))
+            text(elem, "AbbrName", "Fld{}".format(tag))
+            text(elem, "NotReqXML", "0")
+            text(elem, "Description", description("Field", tag))
+        return root
+
+    def basic_enums(self):
+        root = self.basic_root("Enums")
+        for tag in self.enum_tags():
+            for value in range(self.enums_per_field):
+                elem = SubElement(root, "Enum", **history(tag + value))
+                text(elem, "Tag", str(tag))
+                text(elem, "Value", str(value))
+                text(elem, "SymbolicName", "Value{}".format(value))
+                text(elem, "Description", description("Value", value))
+        return root
+
+    def basic_components(self):
+        root = self.basic_root("Components")
+        for id in self.component_ids():
+            elem = SubElement(root, "Component", **history(id))
+            text(elem, "ComponentID", str(id))
+            text(elem, "ComponentType", "Block")
+            text(elem, "CategoryID", "Category0")
+            text(elem, "Name", "Component{}".format(id))
+            text(elem, "NotReqXML", "0")
+            text(elem, "Description", description("Component", id))
+        return root
+
+    def basic_messages(self):
+        root = self.basic_root("Messages")
+        for (id, msg_type) in enumerate(self.msg_types(), 1):
+            elem = SubElement(root, "Message", **history(id))
+            text(elem, "ComponentID", str(id))
+            text(elem, "MsgType", msg_type)
+            text(elem, "Name", "Message{}".format(id))
+            text(elem, "CategoryID", "Category{}".format(id % 10))
+            text(elem, "SectionID", "Section{}".format(id % 3))
+            text(elem, "NotReqXML", "0")
+            text(elem, "Description", description("Message", id))
+        return root
+
+    def basic_msg_contents(self):
+        root = self.basic_root("MsgContents")
+        parents = list(range(1, self.messages + 1)) + list(self.component_ids())
+        for parent in parents:
+            for (position, (kind, ref)) in enumerate(self.content_tags(parent), 1):
+                elem = SubElement(root, "MsgContent", added="FIX.4.4")
+                text(elem, "ComponentID", str(parent))
+                if kind == "field":
+                    text(elem, "TagText", str(ref))
+                else:
+                    text(elem, "TagText", "Component{}".format(ref))
+                text(elem, "Indent", "0")
+                text(elem, "Position", str(position))
+                text(elem, "Reqd", str(position % 2))
+                text(elem, "Description", "")
+        return root
+
+    def write_unified(self, path, phrases_path):
+        """
+        Writes a "Unified" repository file with a single FIX version, plus
+        its phrases file.
+        """
+        root = Element("fixRepository", version="1.0")
+        fix = SubElement(root, "fix", version=VERSION)
+        phrases = Element("phrases")
+
+        def phrase(text_id, paragraph):
+            elem = SubElement(phrases, "phrase", textId=text_id)
+            txt = SubElement(elem, "text", purpose="SYNOPSIS")
+            SubElement(txt, "para").text = paragraph
+
+        abbreviations = SubElement(fix, "abbreviations")
+        for i in range(self.fields // 10):
+            text_id = "AT_Abbr{}".format(i)
+            SubElement(
+                abbreviations, "abbreviation", abbrTerm="Abbr{}".format(i), textId=text_id
+            )
+            phrase(text_id, "Abbreviated term {}".format(i))
+        categories = SubElement(fix, "categories")
+        for i in range(10):
+            text_id = "CAT_Category{}".format(i)
+            SubElement(
+                categories,
+                "category",
+                id="Category{}".format(i),
+                componentType="Message",
+                section="Section{}".format(i % 3),
+                textId=text_id,
+            )
+            phrase(text_id, "Category {}.".format(i))
+        sections = SubElement(fix, "sections")
+        for i in range(3):
+            text_id = "SCT_Section{}".format(i)
+            SubElement(
+                sections,
+                "section",
+                id="Section{}".format(i),
+                name="Section {}".format(i),
+                textId=text_id,
+            )
+            phrase(text_id, "Messages of section {}.".format(i))
+        datatypes = SubElement(fix, "datatypes")
+        for i in range(20):
+            text_id = "DT_{}".format(datatype(i))
+            SubElement(datatypes, "datatype", name=datatype(i), textId=text_id)
+            phrase(text_id, "Datatype {}.".format(i))
+        fields = SubElement(fix, "fields")
+        enum_tags = set(self.enum_tags())
+        for tag in range(1, self.fields + 1):
+            text_id = "FIELD_{}".format(tag)
+            elem = SubElement(
+                fields,
+                "field",
+                id=str(tag),
+                name="Field{}".format(tag),
+                type=datatype(tag),
+                textId=text_id,
+                **history(tag)
+            )
+            phrase(text_id, description("Field", tag))
+            if tag in enum_tags:
+                for value in range(self.enums_per_field):
+                    enum_text_id = "ENUM_{}_{}".format(tag, value)
+                    SubElement(
+                        elem,
+                        "enum",
+                        value=str(value),
+                        symbolicName="Value{}".format(value),
+                        textId=enum_text_id,
+                    )
+                    phrase(enum_text_id, description("Value", value))
+        components = SubElement(fix, "components")
+        for id in self.component_ids():
+            text_id = "COMP_Component{}".format(id)
+            elem = SubElement(
+                components,
+                "component",
+                id=str(id),
+                name="Component{}".format(id),
+                type="Block",
+                category="Category0",
+                textId=text_id,
+                **history(id)
+            )
+            phrase(text_id, description("Component", id))
+            self.unified_refs(elem, id)
+        messages = SubElement(fix, "messages")
+        for (id, msg_type) in enumerate(self.msg_types(), 1):
+            text_id = "MSG_{}".format(id)
+            elem = SubElement(
+                messages,
+                "message",
+                id=str(id),
+                name="Message{}".format(id),
+                msgType=msg_type,
+                category="Category{}".format(id % 10),
+                textId=text_id,
+                **history(id)
+            )
+            phrase(text_id, description("Message", id))
+            self.unified_refs(SubElement(elem, "structure"), id)
+        ElementTree(root).write(path, encoding="utf-8")
+        ElementTree(phrases).write(phrases_path, encoding="utf-8")
+
+    def unified_refs(self, parent, id):
+        for (kind, ref) in self.content_tags(id):
+            SubElement(parent, kind + "Ref", id=str(ref), required="0")
+
+    def write_ep(self, path, ep, updates):
+        """
+        Writes an Extension Pack which adds a few fields and updates
+        `updates` existing ones.
+        """
+        root = Element("ExtensionPack", id=str(ep), approved="2020-01-01")
+        fields = SubElement(root, "Fields")
+        inserts = SubElement(fields, "Inserts")
+        for tag in range(self.fields + 1, self.fields + 1 + max(1, updates // 10)):
+            self.ep_field(inserts, tag, ep)
+        updated = SubElement(fields, "Updates")
+        for i in range(updates):
+            self.ep_field(updated, (ep * updates + i) % self.fields + 1, ep)
+        ElementTree(root).write(path, encoding="utf-8")
+
+    def ep_field(self, parent, tag, ep):
+        elem = SubElement(
+            parent, "Field", added="FIX.5.0SP2", addedEP=str(ep), updatedEP=str(ep)
+        )
+        text(elem, "Tag", str(tag))
+        text(elem, "Name", "Field{}".format(tag))
+        text(elem, "Type", datatype(tag))
+        text(elem, "Description", description("Field", tag) + " Updated.")
+
+
+def text(parent, tag, value):
+    SubElement(parent, tag).text = value
+
+
+def datatype(i):
+    return "Datatype{}".format(i % 20)
+
+
+def history(i):
+    attrs = {"added": "FIX.4.{}".format(i % 5)}
+    if i % 3 == 0:
+        attrs.update(updated="FIX.5.0SP2", updatedEP=str(90 + i % 150))
+    return attrs
+
+
+def description(kind, i):
+    return (
+        "{} number {}. This value MUST be set whenever the ISO 4217 currency "
+        "code is not implied by the instrument.".format(kind, i)
+    )
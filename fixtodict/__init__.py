@@ -3,4 +3,6 @@ from .extension_pack import ExtensionPack  # NOQA
 from .schema import validate_v1  # NOQA
 from .review import RepositoryReview  # NOQA
 from .fix_version import FixVersion  # NOQA
+from .store import Store  # NOQA
+from .timeline import Timeline  # NOQA
 from .__version__ import __version__  # NOQA
@@ -18,8 +18,33 @@ from .xml_logic import (
     embed_enums_into_field,
     embed_msg_contents_into_message,
     embed_msg_contents_into_component,
+    embed_kinds_into_msg_contents,
+    msg_content_kinds,
 )
+from .xml_logic.records import records_to_dicts_in_place
 from .xml_logic.utils import get_fuzzy
+from .profiling import NULL_PROFILER
+
+
+# Source files of a Basic repository: the corresponding argument of
+# `transform_basic_repository_v1`, filename, converter and whether it's
+# optional.
+BASIC_REPOSITORY_V1_FILES = [
+    ("abbreviations", "Abbreviations.xml", xml_to_abbreviations, True),
+    ("categories", "Categories.xml", xml_to_categories, True),
+    ("components", "Components.xml", xml_to_components, True),
+    ("datatypes", "Datatypes.xml", xml_to_datatypes, True),
+    ("enums", "Enums.xml", xml_to_enums, False),
+    ("fields", "Fields.xml", xml_to_fields, False),
+    ("messages", "Messages.xml", xml_to_messages, False),
+    ("msg_contents", "MsgContents.xml", xml_to_msg_contents, False),
+    ("sections", "Sections.xml", xml_to_sections, True),
+]
+
+BASIC_REPOSITORY_V1_FILES_BY_KIND = {
+    kind: (filename, xml_to_dict, opt)
+    for (kind, filename, xml_to_dict, opt) in BASIC_REPOSITORY_V1_FILES
+}
 
 
 def transform_basic_repository_v1(
@@ -32,38 +57,62 @@ def transform_basic_repository_v1(
     messages: Element,
     msg_contents: Element,
     sections: Element,
+    profiler=NULL_PROFILER,
 ):
+    roots = {
+        "abbreviations": abbreviations,
+        "categories": categories,
+        "components": components,
+        "datatypes": datatypes,
+        "enums": enums,
+        "fields": fields,
+        "messages": messages,
+        "msg_contents": msg_contents,
+        "sections": sections,
+    }
     fix_version = FixVersion(get_fuzzy(messages, "version")).data
-    abbreviations = xml_to_abbreviations(abbreviations)
-    categories = xml_to_categories(categories)
-    components = xml_to_components(components)
-    datatypes = xml_to_datatypes(datatypes)
-    enums = xml_to_enums(enums)
-    fields = xml_to_fields(fields)
-    messages = xml_to_messages(messages)
-    msg_contents = xml_to_msg_contents(msg_contents)
-    sections = xml_to_sections(sections)
+    converted = {}
+    for (kind, _, xml_to_dict, _) in BASIC_REPOSITORY_V1_FILES:
+        with profiler.stage(xml_to_dict.__name__) as stage:
+            converted[kind] = xml_to_dict(roots[kind])
+            stage["count"] = len(converted[kind])
+    return embed_basic_repository_v1(fix_version, profiler=profiler, **converted)
+
+
+def embed_basic_repository_v1(
+    fix_version,
+    abbreviations,
+    categories,
+    components,
+    datatypes,
+    enums,
+    fields,
+    messages,
+    msg_contents,
+    sections,
+    profiler=NULL_PROFILER,
+):
+    """
+    Completes a Basic repository out of the results of its `xml_to_*`
+    converters, which are modified in place.
+    """
+    with profiler.stage("records_to_dicts", len(enums) + len(msg_contents)):
+        records_to_dicts_in_place(enums)
+        records_to_dicts_in_place(msg_contents)
     # Embeddings.
-    for val in fields.values():
-        embed_enums_into_field(val, enums)
-    for val in messages.values():
-        embed_msg_contents_into_message(val, msg_contents)
-    for (key, val) in components.items():
-        embed_msg_contents_into_component(val, key, msg_contents)
+    with profiler.stage("embed_enums_into_field", len(fields)):
+        for val in fields.values():
+            embed_enums_into_field(val, enums)
+    with profiler.stage("embed_msg_contents", len(messages) + len(components)):
+        for val in messages.values():
+            embed_msg_contents_into_message(val, msg_contents)
+        for (key, val) in components.items():
+            embed_msg_contents_into_component(val, key, msg_contents)
     # Check the kind of content inside messages.
-    for (message_id, msg_contents_by_tag) in msg_contents.items():
-        for element in msg_contents_by_tag:
-            if element["tag"] in fields:
-                element["kind"] = "field"
-            elif element["tag"] in [c["name"] for c in components.values()]:
-                element["kind"] = "component"
-            else:
-                print(
-                    "-- UNKNOWN MSG_CONTENTS with msg. id {} and tag {}".format(
-                        message_id, element["tag"]
-                    ),
-                    file=sys.stderr,
-                )
+    with profiler.stage("embed_kinds_into_msg_contents", len(msg_contents)):
+        embed_kinds_into_msg_contents(
+            msg_contents, msg_content_kinds(fields, components)
+        )
     return {
         "meta": {
             "schema": "1",
@@ -0,0 +1,47 @@
+"""
+MessagePack encoding of FIXtodict data. It holds exactly the same structure
+as JSON output, but is considerably more compact and faster to load.
+
+Requires the optional `msgpack` package (`pip3 install fixtodict[msgpack]`).
+"""
+
+
+def import_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "MessagePack support requires the 'msgpack' package: "
+            "pip3 install fixtodict[msgpack]"
+        )
+    return msgpack
+
+
+def write_msgpack(data, f):
+    """
+    Writes `data` to the binary file object `f`. Like JSON output, top-level
+    members and then their entries are packed one at a time, so the whole
+    encoded document is never held in memory.
+    """
+    msgpack = import_msgpack()
+    packer = msgpack.Packer(use_bin_type=True)
+    f.write(packer.pack_map_header(len(data)))
+    for (key, section) in data.items():
+        f.write(packer.pack(key))
+        if isinstance(section, dict):
+            f.write(packer.pack_map_header(len(section)))
+            for (entry_key, entry) in section.items():
+                f.write(packer.pack(entry_key))
+                f.write(packer.pack(entry))
+        else:
+            f.write(packer.pack(section))
+
+
+def read_msgpack(path):
+    """
+    Loads MessagePack data written by FIXtodict back into a dict, exactly as
+    `json.load` would do with the equivalent JSON output.
+    """
+    msgpack = import_msgpack()
+    with open(path, "rb") as f:
+        return msgpack.unpack(f, raw=False)
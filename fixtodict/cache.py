@@ -0,0 +1,67 @@
+import hashlib
+import os
+import pickle
+
+from .__version__ import __version__
+from .store import Store, StoreSection, write_store
+
+
+def file_md5(path):
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class SourceCache:
+    """
+    On-disk cache for the results of `xml_to_*` converters, one entry per
+    source file. Entries are keyed by the file's MD5 and by FIXtodict version,
+    so changes to either invalidate them. Stale entries are never read again
+    and can be safely deleted.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def entry_path(self, kind, digest, extension="pickle"):
+        filename = "{}-{}-{}.{}".format(kind, digest, __version__, extension)
+        return os.path.join(self.path, filename)
+
+    def load(self, kind, src_path, convert):
+        """
+        Returns the cached value for `src_path`, or computes it with
+        `convert()` and stores it. Missing files are never cached.
+        """
+        if not os.path.isfile(src_path):
+            return convert()
+        path = self.entry_path(kind, file_md5(src_path))
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        value = convert()
+        # Write then rename, so concurrent builds never see partial entries.
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return value
+
+    def load_store(self, kind, src_path, convert):
+        """
+        Like `load`, but `convert()` must return a dict and the cache entry
+        is a random-access store, which is returned as a `StoreSection` over
+        that dict's entries. Nothing is deserialized upfront, so it's
+        suitable for large lookup tables shared by several processes.
+        """
+        path = self.entry_path(kind, file_md5(src_path), "store")
+        if not os.path.isfile(path):
+            tmp_path = "{}.{}.tmp".format(path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                write_store({kind: convert()}, f)
+            os.replace(tmp_path, path)
+        return StoreSection(Store(path), kind)
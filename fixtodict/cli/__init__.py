@@ -1,12 +1 @@
 from .main import cli  # NOQA
-
-from .schema import schema  # NOQA
-from .ep import ep  # NOQA
-from .filter_patch import filter_patch
-from .patch import patch  # NOQA
-from .o_repo import o_repo  # NOQA
-from .repo import repo  # NOQA
-from .repou import repou  # NOQA
-from .review import review  # NOQA
-from .validate import validate  # NOQA
-from .xref import xref  # NOQA
@@ -0,0 +1,94 @@
+import click
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from . import cli
+from .utils.json import output_json
+from .utils.options import opt_output, opt_compact
+from .utils.xml import strip_namespace
+from ..extension_pack import ExtensionPack
+from ..patch import consolidate_patches
+
+EP_DIR = re.compile(r"^EP(\d+)$")
+
+
+def find_extension_packs(src):
+    # `tools/download.py` extracts each EP into its own `EP<n>/` directory.
+    return [
+        os.path.join(src, name)
+        for name in os.listdir(src)
+        if EP_DIR.match(name) and os.path.isdir(os.path.join(src, name))
+    ]
+
+
+def read_extension_pack_patch(directory):
+    # Returns either (EP id, path, operations) or an error message, so that
+    # a bad EP doesn't abort the whole batch. EP directories also contain
+    # full FIX Repository files, so "EP*.xml" files are tried first.
+    filenames = sorted(
+        (f for f in os.listdir(directory) if f.lower().endswith(".xml")),
+        key=lambda f: (not f.upper().startswith("EP"), f),
+    )
+    for path in (os.path.join(directory, f) for f in filenames):
+        try:
+            root = ElementTree.parse(path).getroot()
+        except ElementTree.ParseError as e:
+            return "Invalid XML file '{}': {}".format(path, e)
+        strip_namespace(root)
+        if root.tag != "ExtensionPack":
+            root = root.find("ExtensionPack")
+        if root is not None:
+            ep = ExtensionPack(root)
+            try:
+                ep_id = int(ep.id)
+            except (TypeError, ValueError):
+                return "Invalid EP id {!r} in '{}'".format(ep.id, path)
+            return (ep_id, path, ep.to_jsonpatch().patch)
+    return "No Extension Pack found in '{}'".format(directory)
+
+
+@cli.command()
+@click.argument("src", nargs=1, type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@opt_output("output")
+@opt_compact("compact")
+def ep_batch(src, jobs, output, compact):
+    """
+    Merge many XML-formatted EP files into a single JSON Patch.
+
+    <SRC> is a directory containing one `EP<n>/` subdirectory per Extension
+    Pack, as created by `tools/download.py`. EPs are parsed concurrently and
+    their JSON Patches are merged in order of EP id; changes superseded by
+    later EPs are dropped. The result can be applied in one pass by 'patch'.
+    """
+    start = time.perf_counter()
+    dirs = find_extension_packs(src)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(read_extension_pack_patch, dirs))
+    for result in results:
+        if isinstance(result, str):
+            click.echo("-- " + result, err=True)
+    results = sorted(r for r in results if not isinstance(r, str))
+    ops = consolidate_patches(
+        [patch for (_, _, patch) in results], ExtensionPack.KINDS
+    )
+    output_json(ops, output, compact)
+    click.echo(
+        "-- Merged {} EPs ({} -> {} operations) in {:.2f}s.".format(
+            len(results),
+            sum(len(patch) for (_, _, patch) in results),
+            len(ops),
+            time.perf_counter() - start,
+        ),
+        err=True,
+    )
@@ -0,0 +1,31 @@
+import click
+
+from . import cli
+from .utils import err
+from .utils.json import output_json
+from .utils.options import opt_compact
+from ..store import Store, StoreError
+
+
+@cli.command()
+@click.argument("store", nargs=1, type=click.Path(exists=True, dir_okay=False))
+@click.argument("pointer", nargs=1)
+@opt_compact("compact")
+def get(store, pointer, compact):
+    """
+    Print a single value out of a store.
+
+    <STORE> is a file produced with '--format store' by 'repo' or 'repou'.
+    <POINTER> is a JSON Pointer into its data, e.g. '/fields/35' or
+    'messages/D'. Only the entries it refers to are actually loaded, so this
+    is fast regardless of store size.
+    """
+    try:
+        with Store(store) as s:
+            value = s.get(pointer)
+    except StoreError:
+        err("store")
+    except KeyError:
+        print("Error: '{}' not found.".format(pointer))
+        exit(-1)
+    output_json(value, compact=compact)
@@ -1,9 +1,43 @@
 import click
+import importlib
 
 from ..__version__ import __version__
 
+# Subcommands by name, along with the module that defines them. Modules are
+# only imported when needed, so e.g. 'fixtodict schema' doesn't pay for XML
+# processing, JSON Patch or JSON Schema libraries.
+SUBCOMMANDS = {
+    "schema": "schema",
+    "ep": "ep",
+    "ep-batch": "ep_batch",
+    "filter-patch": "filter_patch",
+    "get": "get",
+    "patch": "patch",
+    "o-repo": "o_repo",
+    "repo": "repo",
+    "repo-batch": "repo_batch",
+    "repou": "repou",
+    "repou-batch": "repou_batch",
+    "review": "review",
+    "timeline": "timeline",
+    "validate": "validate",
+    "xref": "xref",
+}
 
-@click.group(name="FIXtodict")
+
+class LazyGroup(click.Group):
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(SUBCOMMANDS))
+
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in SUBCOMMANDS:
+            # Subcommand modules register themselves on import.
+            module = importlib.import_module("." + SUBCOMMANDS[name], __package__)
+            return getattr(module, SUBCOMMANDS[name])
+        return super().get_command(ctx, name)
+
+
+@click.group(name="FIXtodict", cls=LazyGroup)
 @click.version_option(__version__)
 def cli():
     """
@@ -1,16 +1,18 @@
 import click
 import jsonpatch
-import json
 
 from . import cli
 from .utils.xml import read_xml_root
-from .utils.json import read_json, DEFAULT_INDENT
+from .utils.json import read_json, output_json
+from .utils.options import opt_output, opt_compact
 from ..repository import transform_orchestra_v1
 
 
 @cli.command()
 @click.argument("src", nargs=1, type=click.Path(exists=True))
-def o_repo(src):
+@opt_output("output")
+@opt_compact("compact")
+def o_repo(src, output, compact):
     root = read_xml_root("", src, opt=False)
     data = transform_orchestra_v1(root)
-    print(json.dumps(data, indent=DEFAULT_INDENT))
+    output_json(data, output, compact)
@@ -1,19 +1,40 @@
 import click
-import json
 import jsonpatch
+from jsonpointer import JsonPointerException
 
 from . import cli
-from .utils.json import read_json, DEFAULT_INDENT
-from ..patch import apply_patch
+from .utils.json import read_json, output_json
+from .utils.options import opt_output, opt_compact
+from ..patch import apply_patches
 
 
 @cli.command()
 @click.argument("src", nargs=1, type=click.Path(exists=True))
-@click.argument("path-to-patch", nargs=1, type=click.Path(exists=True))
-def patch(src, path_to_patch):
+@click.argument(
+    "paths-to-patches", nargs=-1, required=True, type=click.Path(exists=True)
+)
+@click.option(
+    "--incremental",
+    "incremental",
+    default=False,
+    is_flag=True,
+    help=(
+        "Assume <SRC> is valid and only validate what the patches change. "
+        "Off by default."
+    ),
+)
+@opt_output("output")
+@opt_compact("compact")
+def patch(src, paths_to_patches, incremental, output, compact):
     """
-    Apply a JSON Patch file.
+    Apply one or more JSON Patch files, in order.
+
+    All patches are applied in a single pass over <SRC>.
     """
-    patch = jsonpatch.JsonPatch(read_json(path_to_patch))
-    data = apply_patch(read_json(src), patch)
-    print(json.dumps(data, indent=DEFAULT_INDENT))
+    patches = [read_json(path) for path in paths_to_patches]
+    try:
+        data = apply_patches(read_json(src), patches, incremental=incremental)
+    except (jsonpatch.JsonPatchException, JsonPointerException) as e:
+        print("Error: {}".format(e))
+        exit(-1)
+    output_json(data, output, compact)
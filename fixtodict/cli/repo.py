@@ -3,20 +3,51 @@ import jsonpatch
 import json
 import os
 from checksumdir import dirhash
+from concurrent.futures import ProcessPoolExecutor
 
 from . import cli
-from .utils.options import opt_patch
-from .utils.xml import read_xml_root
+from .utils.options import (
+    opt_patch,
+    opt_stream,
+    opt_cache,
+    opt_profile,
+    opt_output,
+    opt_compact,
+    opt_format,
+)
+from .utils.xml import read_xml_root, stream_xml_root
 from .utils.json import read_json, DEFAULT_INDENT
-from ..basic_repository_v1 import transform_basic_repository_v1
+from .utils.output import output_data
+from ..basic_repository_v1 import (
+    BASIC_REPOSITORY_V1_FILES,
+    BASIC_REPOSITORY_V1_FILES_BY_KIND,
+    embed_basic_repository_v1,
+)
+from ..cache import SourceCache
 from ..fix_version import FixVersion
 from ..schema import validate_v1
 from ..patch import apply_patch
+from ..profiling import Profiler, NULL_PROFILER
+from ..xml_logic.utils import get_fuzzy
 
 
 @cli.command()
 @click.argument("src", nargs=1, type=click.Path(exists=True))
-def repo(src):
+@opt_stream("stream")
+@opt_cache("cache_dir")
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Convert XML files on this many worker processes. Defaults to 1.",
+)
+@opt_profile("profile")
+@opt_output("output")
+@opt_compact("compact")
+@opt_format("fmt")
+def repo(src, stream, cache_dir, jobs, profile, output, compact, fmt):
     """
     Transform original FIX Repository data into JSON.
 
@@ -54,18 +85,85 @@ def repo(src):
     Output data is written to <DST>, which must be an existing directory.
     Filenames are properly generated according to FIX protocol version. Old
     files in <DST> might get overwritten WITHOUT BACKUP!
+
+    With --stream, XML files are parsed incrementally and each record is
+    discarded right after conversion, which keeps memory usage low on large
+    repositories.
+
+    With --cache, the results of XML conversion are stored on disk and reused
+    for unchanged files on subsequent runs.
+
+    With --jobs, XML files are parsed and converted concurrently. Output is
+    the same regardless.
+
+    With --profile, a report of time and memory spent on each stage is
+    written to the given file.
+    """
+    profiler = Profiler() if profile else NULL_PROFILER
+    data = build_basic_repository(src, stream, cache_dir, profiler, jobs)
+    with profiler.stage("output_data"):
+        output_data(data, output, fmt, compact)
+    if profile:
+        with open(profile, "w") as f:
+            json.dump(profiler.to_dict(), f, indent=DEFAULT_INDENT)
+
+
+def build_basic_repository(
+    src, stream=False, cache_dir=None, profiler=NULL_PROFILER, jobs=1
+):
+    kinds = [kind for (kind, _, _, _) in BASIC_REPOSITORY_V1_FILES]
+    if jobs > 1:
+        # Files are independent of each other. Results are collected in a
+        # fixed order, so output is the same as with a single process.
+        with profiler.stage("convert_basic_files", len(kinds)):
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(convert_basic_file, src, kind, stream, cache_dir)
+                    for kind in kinds
+                ]
+                results = [future.result() for future in futures]
+    else:
+        results = [
+            convert_basic_file(src, kind, stream, cache_dir, profiler)
+            for kind in kinds
+        ]
+    versions = {kind: version for (kind, (version, _)) in zip(kinds, results)}
+    converted = {kind: data for (kind, (_, data)) in zip(kinds, results)}
+    fix_version = FixVersion(versions["messages"]).data
+    data = embed_basic_repository_v1(fix_version, profiler=profiler, **converted)
+    with profiler.stage("dirhash"):
+        data["meta"]["fixtodict"]["md5"] = dirhash(src, "md5")
+    with profiler.stage("validate_v1"):
+        validate_v1(data)
+    return data
+
+
+def convert_basic_file(
+    src, kind, stream=False, cache_dir=None, profiler=NULL_PROFILER
+):
     """
-    data = transform_basic_repository_v1(
-        abbreviations=read_xml_root(src, "Abbreviations.xml"),
-        categories=read_xml_root(src, "Categories.xml"),
-        components=read_xml_root(src, "Components.xml"),
-        datatypes=read_xml_root(src, "Datatypes.xml"),
-        enums=read_xml_root(src, "Enums.xml", opt=False),
-        fields=read_xml_root(src, "Fields.xml", opt=False),
-        messages=read_xml_root(src, "Messages.xml", opt=False),
-        msg_contents=read_xml_root(src, "MsgContents.xml", opt=False),
-        sections=read_xml_root(src, "Sections.xml"),
-    )
-    data["meta"]["fixtodict"]["md5"] = dirhash(src, "md5")
-    validate_v1(data)
-    print(json.dumps(data, indent=DEFAULT_INDENT))
+    Reads and converts the file of a Basic repository which holds `kind`
+    data. Returns the FIX version it declares and the converted data.
+    """
+    (filename, xml_to_dict, opt) = BASIC_REPOSITORY_V1_FILES_BY_KIND[kind]
+    read = stream_xml_root if stream else read_xml_root
+
+    def convert(profiler=profiler):
+        with profiler.stage("{}[{}]".format(read.__name__, filename)) as stage:
+            root = read(src, filename, opt=opt)
+            if root is not None and not stream:
+                stage["count"] = len(root)
+        version = get_fuzzy(root, "version") if root is not None else None
+        with profiler.stage(xml_to_dict.__name__) as stage:
+            data = xml_to_dict(root)
+            stage["count"] = len(data)
+        return (version, data)
+
+    if cache_dir is None:
+        return convert()
+    path = os.path.join(src, filename)
+    with profiler.stage("SourceCache.load[{}]".format(filename)) as stage:
+        cache = SourceCache(cache_dir)
+        result = cache.load(kind, path, lambda: convert(NULL_PROFILER))
+        stage["count"] = len(result[1])
+    return result
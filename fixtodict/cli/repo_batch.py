@@ -0,0 +1,74 @@
+import click
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from natsort import natsorted
+
+from . import cli
+from .repo import build_basic_repository
+from .utils.options import opt_stream, opt_cache
+from .utils.json import write_json
+from ..fix_version import fix_version_slug
+
+
+def find_basic_repositories(src):
+    # Original FIX Repository releases keep "Basic" files under `Base/`.
+    dirs = []
+    for name in natsorted(os.listdir(src)):
+        path = os.path.join(src, name)
+        if os.path.isfile(os.path.join(path, "Base", "Messages.xml")):
+            dirs.append(os.path.join(path, "Base"))
+        elif os.path.isfile(os.path.join(path, "Messages.xml")):
+            dirs.append(path)
+    return dirs
+
+
+def build_and_write(src, dst, stream, cache_dir):
+    start = time.perf_counter()
+    data = build_basic_repository(src, stream, cache_dir)
+    path = os.path.join(dst, fix_version_slug(data["meta"]["version"]) + ".json")
+    with open(path, "w") as f:
+        write_json(data, f)
+    return (path, time.perf_counter() - start)
+
+
+@cli.command()
+@click.argument("src", nargs=1, type=click.Path(exists=True, file_okay=False))
+@click.argument("dst", nargs=1, type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@opt_stream("stream")
+@opt_cache("cache_dir")
+def repo_batch(src, dst, jobs, stream, cache_dir):
+    """
+    Transform several FIX Repository versions into JSON, concurrently.
+
+    <SRC> is a directory containing one subdirectory per FIX protocol version,
+    each of them "Basic" FIX Repository data as accepted by 'repo' (either
+    directly or inside a `Base/` subdirectory).
+
+    Output data is written to <DST>, which must be an existing directory.
+    Filenames are generated according to FIX protocol version, e.g.
+    `fix-5-0-sp2.json`. Old files in <DST> might get overwritten WITHOUT
+    BACKUP!
+    """
+    start = time.perf_counter()
+    dirs = find_basic_repositories(src)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(build_and_write, d, dst, stream, cache_dir) for d in dirs
+        ]
+        timings = [future.result() for future in futures]
+    for (path, seconds) in timings:
+        print("Written to '{}' ({:.2f}s).".format(path, seconds))
+    print(
+        "-- Built {} versions in {:.2f}s.".format(
+            len(timings), time.perf_counter() - start
+        )
+    )
@@ -5,19 +5,52 @@ import os
 from checksumdir import dirhash
 
 from . import cli
-from .utils.options import opt_patch
-from .utils.xml import read_xml_root
+from .utils.options import (
+    opt_cache,
+    opt_patch,
+    opt_profile,
+    opt_output,
+    opt_compact,
+    opt_format,
+)
+from .utils.xml import stream_xml_root
 from .utils.json import read_json, DEFAULT_INDENT
-from ..unified_repository_v1 import transform_unified_repository_v1
+from .utils.output import output_data
+from ..unified_repository_v1 import iter_unified_repository_v1
+from ..xml_logic import xml_to_docs_definitions
+from ..cache import SourceCache
 from ..fix_version import FixVersion
 from ..schema import validate_v1
 from ..patch import apply_patch
+from ..profiling import Profiler, NULL_PROFILER
+
+
+def load_phrases(path, cache_dir=None):
+    # With a cache, phrases are converted once per phrases file and then
+    # memory-mapped by all later runs.
+    def convert():
+        return xml_to_docs_definitions(stream_xml_root("", path, opt=False))
+
+    if cache_dir is None:
+        return convert()
+    return SourceCache(cache_dir).load_store("phrases", path, convert)
 
 
 @cli.command()
 @click.argument("src", nargs=1, type=click.Path(exists=True))
 @click.argument("phrases", nargs=1, type=click.Path(exists=True))
-def repou(src, phrases):
+@click.option(
+    "--fix-version",
+    "fix_version",
+    default="FIX.5.0SP2",
+    help="Transform this FIX version out of <SRC>. Defaults to FIX.5.0SP2.",
+)
+@opt_cache("cache_dir")
+@opt_profile("profile")
+@opt_output("output")
+@opt_compact("compact")
+@opt_format("fmt")
+def repou(src, phrases, fix_version, cache_dir, profile, output, compact, fmt):
     """
     Transform original FIX Repository data into JSON.
 
@@ -56,7 +89,19 @@ def repou(src, phrases):
     Filenames are properly generated according to FIX protocol version. Old
     files in <DST> might get overwritten WITHOUT BACKUP!
     """
-    root = read_xml_root("", src, opt=False)[8]
-    phrases = read_xml_root("", phrases, opt=False)
-    data = transform_unified_repository_v1(root, phrases)
-    print(json.dumps(data, indent=DEFAULT_INDENT))
+    profiler = Profiler() if profile else NULL_PROFILER
+    with profiler.stage("load_phrases") as stage:
+        phrases = load_phrases(phrases, cache_dir)
+        stage["count"] = len(phrases)
+    # Other versions are skipped as <SRC> is read.
+    fixes = stream_xml_root("", src, opt=False)
+    datas = iter_unified_repository_v1(fixes, phrases, [fix_version], profiler)
+    data = next(datas, None)
+    if data is None:
+        print("Error: FIX version '{}' not found.".format(fix_version))
+        exit(-1)
+    with profiler.stage("output_data"):
+        output_data(data, output, fmt, compact)
+    if profile:
+        with open(profile, "w") as f:
+            json.dump(profiler.to_dict(), f, indent=DEFAULT_INDENT)
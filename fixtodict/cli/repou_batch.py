@@ -0,0 +1,82 @@
+import click
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import cli
+from .repou import load_phrases
+from .utils.json import write_json
+from .utils.options import opt_cache
+from .utils.xml import stream_xml_root
+from ..fix_version import fix_version_slug
+from ..unified_repository_v1 import transform_unified_fix_v1
+
+# Docs definitions, set once per worker process.
+PHRASES = None
+
+
+def init_worker(phrases, path, cache_dir):
+    # Cached phrases are memory-mapped by each worker rather than copied.
+    global PHRASES
+    PHRASES = load_phrases(path, cache_dir) if phrases is None else phrases
+
+
+def transform_and_write(fix, dst):
+    start = time.perf_counter()
+    data = transform_unified_fix_v1(pickle.loads(fix), PHRASES)
+    path = os.path.join(dst, fix_version_slug(data["meta"]["version"]) + ".json")
+    with open(path, "w") as f:
+        write_json(data, f)
+    return (path, time.perf_counter() - start)
+
+
+@cli.command()
+@click.argument("src", nargs=1, type=click.Path(exists=True, dir_okay=False))
+@click.argument("phrases", nargs=1, type=click.Path(exists=True, dir_okay=False))
+@click.argument("dst", nargs=1, type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@opt_cache("cache_dir")
+def repou_batch(src, phrases, dst, jobs, cache_dir):
+    """
+    Transform all FIX versions in a "Unified" FIX Repository into JSON.
+
+    <SRC> is read only once: each FIX version is handed over to a worker
+    process as soon as it's been parsed, while the next one is being read.
+    <PHRASES> is parsed once as well, and shared by all versions; with
+    '--cache', it's only parsed again when it changes.
+
+    Output data is written to <DST>, which must be an existing directory.
+    Filenames are generated according to FIX protocol version, e.g.
+    `fix-5-0-sp2.json`. Old files in <DST> might get overwritten WITHOUT
+    BACKUP!
+    """
+    start = time.perf_counter()
+    path = phrases
+    phrases = load_phrases(path, cache_dir)
+    if cache_dir is not None:
+        phrases = None
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(phrases, path, cache_dir)
+    ) as executor:
+        # Elements are cleared as soon as the stream moves on, so they must
+        # be serialized right away rather than whenever the executor does.
+        futures = [
+            executor.submit(transform_and_write, pickle.dumps(fix), dst)
+            for fix in stream_xml_root("", src, opt=False)
+        ]
+        timings = [future.result() for future in futures]
+    for (path, seconds) in timings:
+        print("Written to '{}' ({:.2f}s).".format(path, seconds))
+    print(
+        "-- Built {} versions in {:.2f}s.".format(
+            len(timings), time.perf_counter() - start
+        )
+    )
@@ -1,5 +1,5 @@
 from . import cli
-from ..schema import JSON_SCHEMA_V1
+from ..schema import json_schema_v1
 
 
 @cli.command()
@@ -7,4 +7,4 @@ def schema():
     """
     Print the JSON Schema used by FIXtodict.
     """
-    print(JSON_SCHEMA_V1)
+    print(json_schema_v1())
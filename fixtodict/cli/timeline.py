@@ -0,0 +1,43 @@
+import click
+import os
+
+from . import cli
+from .utils.json import read_json
+from ..store import pointer_parts
+from ..timeline import Timeline
+
+
+@cli.command()
+@click.argument("index", nargs=1, type=click.Path(dir_okay=False))
+@click.argument("src", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--show",
+    "pointers",
+    multiple=True,
+    help="Print the history of this entry, e.g. 'fields/1300'.",
+)
+def timeline(index, src, pointers):
+    """
+    Track entries across FIX protocol versions and EPs.
+
+    <INDEX> is a timeline index file, which is created if missing. JSON
+    files given as <SRC>, as produced by 'repo', 'repou' or 'patch', are
+    added to it; only their own version is processed, so the index can be
+    kept up to date as new versions and EPs come out. Adding a version again
+    replaces it.
+    """
+    tl = Timeline.load(index) if os.path.isfile(index) else Timeline()
+    for path in src:
+        version = tl.add(read_json(path))
+        print("-- Added {} from '{}'.".format(version, path))
+    if src:
+        tl.save(index)
+        print("-- Written to '{}'".format(index))
+    for pointer in pointers:
+        parts = pointer_parts(pointer)
+        if len(parts) != 2:
+            print("Error: '{}' is not an entry, e.g. 'fields/1300'.".format(pointer))
+            exit(-1)
+        print("/".join(parts))
+        for (version, event, digest) in tl.history(*parts):
+            print("  {:<20} {:<8} {}".format(str(version), event, digest or ""))
@@ -1,9 +1,13 @@
 import json
+import sys
 
 from . import err
 
 DEFAULT_INDENT = 2
 
+# Top-level members, then their entries, are written one at a time.
+STREAMING_DEPTH = 2
+
 
 def beautify_json(json_string: str):
     return json.dumps(json.loads(json_string), indent=DEFAULT_INDENT)
@@ -15,3 +19,49 @@ def read_json(path):
             return json.load(f)
     except json.JSONDecodeError:
         err("JSON")
+
+
+def write_json(data, f, indent=DEFAULT_INDENT):
+    """
+    Writes `data` to the file object `f` section by section and entry by
+    entry, so that memory usage is bounded by the largest single entry rather
+    than the whole document. Output is the same as `print(json.dumps(data,
+    indent=indent))`; `indent=None` produces compact output instead.
+    """
+    if indent is None:
+        separators = (",", ":")
+    else:
+        separators = (",", ": ")
+    write_json_value(f, data, indent, separators, 0, STREAMING_DEPTH)
+    f.write("\n")
+
+
+def write_json_value(f, value, indent, separators, level, depth):
+    if depth == 0 or not isinstance(value, dict) or not value:
+        text = json.dumps(value, indent=indent, separators=separators)
+        if indent is not None and level > 0:
+            # Strings never contain raw newlines, only indentation does.
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        f.write(text)
+        return
+    f.write("{")
+    for (i, (key, val)) in enumerate(value.items()):
+        if i > 0:
+            f.write(separators[0])
+        if indent is not None:
+            f.write("\n" + " " * (indent * (level + 1)))
+        f.write(json.dumps(key) + separators[1])
+        write_json_value(f, val, indent, separators, level + 1, depth - 1)
+    if indent is not None:
+        f.write("\n" + " " * (indent * level))
+    f.write("}")
+
+
+def output_json(data, path=None, compact=False):
+    # Standard output, unless a path is given.
+    indent = None if compact else DEFAULT_INDENT
+    if path is None:
+        write_json(data, sys.stdout, indent)
+    else:
+        with open(path, "w") as f:
+            write_json(data, f, indent)
@@ -63,3 +63,76 @@ def opt_yaml(arg_name):
         is_flag=True,
         help="Also emit YAML besides JSON. Off by default.",
     )(funct)
+
+
+def opt_stream(arg_name):
+    return lambda funct: click.option(
+        "--stream",
+        arg_name,
+        default=False,
+        is_flag=True,
+        help=(
+            "Parse XML files incrementally instead of loading them into "
+            "memory all at once. Off by default."
+        ),
+    )(funct)
+
+
+def opt_cache(arg_name):
+    return lambda funct: click.option(
+        "--cache",
+        arg_name,
+        default=None,
+        help=(
+            "Cache converted XML files in this directory and reuse them when "
+            "unchanged. Off by default."
+        ),
+        type=click.Path(file_okay=False),
+    )(funct)
+
+
+def opt_profile(arg_name):
+    return lambda funct: click.option(
+        "--profile",
+        arg_name,
+        default=None,
+        help=(
+            "Write a JSON report with time, CPU time, element counts and peak "
+            "memory of each stage to this file. Off by default."
+        ),
+        type=click.Path(dir_okay=False),
+    )(funct)
+
+
+def opt_output(arg_name):
+    return lambda funct: click.option(
+        "--output",
+        "-o",
+        arg_name,
+        default=None,
+        help="Write output data to this file instead of standard output.",
+        type=click.Path(dir_okay=False),
+    )(funct)
+
+
+def opt_compact(arg_name):
+    return lambda funct: click.option(
+        "--compact",
+        arg_name,
+        default=False,
+        is_flag=True,
+        help="Emit JSON without any whitespace. Off by default.",
+    )(funct)
+
+
+def opt_format(arg_name):
+    return lambda funct: click.option(
+        "--format",
+        arg_name,
+        default="json",
+        help=(
+            "Output format: JSON, MessagePack for compact binary output, or "
+            "a random-access store for 'fixtodict get'. Defaults to JSON."
+        ),
+        type=click.Choice(["json", "msgpack", "store"]),
+    )(funct)
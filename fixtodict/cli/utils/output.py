@@ -0,0 +1,20 @@
+import sys
+
+from .json import output_json
+from ...binary import write_msgpack
+from ...store import write_store
+
+FORMATS = ["json", "msgpack", "store"]
+BINARY_WRITERS = {"msgpack": write_msgpack, "store": write_store}
+
+
+def output_data(data, path=None, fmt="json", compact=False):
+    # Standard output, unless a path is given. `compact` only affects JSON.
+    if fmt == "json":
+        output_json(data, path, compact)
+    elif path is None:
+        BINARY_WRITERS[fmt](data, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        with open(path, "wb") as f:
+            BINARY_WRITERS[fmt](data, f)
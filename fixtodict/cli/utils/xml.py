@@ -5,14 +5,18 @@ from xml.etree.ElementTree import Element
 from . import err
 
 
-def strip_namespace(el: Element):
+def strip_namespace_shallow(el: Element):
     if el.tag.startswith("{"):
         el.tag = el.tag.split("}", 1)[1]  # strip namespace
-    for k in el.attrib.keys():
+    for k in list(el.attrib.keys()):
         if k.startswith("{"):
             k2 = k.split("}", 1)[1]
             el.attrib[k2] = el.attrib[k]
             del el.attrib[k]
+
+
+def strip_namespace(el: Element):
+    strip_namespace_shallow(el)
     for child in el:
         strip_namespace(child)
 
@@ -27,3 +31,56 @@ def read_xml_root(src, filename, opt=True):
         if not opt:
             err("XML")
     return None
+
+
+class XmlStream:
+    """
+    Incrementally parsed XML document, exposing the same interface as a root
+    `Element` to `xml_to_*` converters: root attributes are available right
+    away and iterating yields each top-level record as soon as it's been
+    parsed. Records are cleared once the consumer moves on, so memory usage
+    doesn't grow with file size. A stream can only be iterated once.
+    """
+
+    def __init__(self, path):
+        self.events = ElementTree.iterparse(path, events=("start", "end"))
+        # Read up to the root start tag: its attributes are needed upfront
+        # (e.g. the FIX version in `Messages.xml`).
+        (_, self.root) = next(self.events)
+        strip_namespace_shallow(self.root)
+        self.tag = self.root.tag
+        self.attrib = dict(self.root.attrib)
+
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
+
+    def findtext(self, path, default=None):
+        # Top-level children are records, never plain text nodes.
+        return default
+
+    def __iter__(self):
+        depth = 0
+        try:
+            for (event, el) in self.events:
+                if event == "start":
+                    strip_namespace_shallow(el)
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 0:
+                    yield el
+                    # The consumer is done with this record.
+                    el.clear()
+                    self.root.remove(el)
+        except ElementTree.ParseError:
+            err("XML")
+
+
+def stream_xml_root(src, filename, opt=True):
+    path = os.path.join(src, filename)
+    try:
+        return XmlStream(path)
+    except (ElementTree.ParseError, FileNotFoundError, StopIteration):
+        if not opt:
+            err("XML")
+    return None
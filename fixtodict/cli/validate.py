@@ -3,7 +3,7 @@ import json
 
 from . import cli
 from .utils.json import read_json
-from ..schema import validate_v1
+from ..schema import iter_errors_v1, error_pointer
 
 
 @cli.command()
@@ -11,5 +11,13 @@ from ..schema import validate_v1
 def validate(src):
     """
     Check a JSON file for correctness.
+
+    All schema violations are reported, each with the JSON Pointer to the
+    offending value. Exits with a non-zero status if there's any.
     """
-    validate_v1(read_json(src))
+    errors = 0
+    for e in iter_errors_v1(read_json(src)):
+        print("-- {}: {}".format(error_pointer(e) or "/", e.message))
+        errors += 1
+    if errors > 0:
+        exit(-1)
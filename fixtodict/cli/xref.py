@@ -3,44 +3,69 @@ import json
 
 from . import cli
 from .utils.json import read_json, DEFAULT_INDENT
+from ..diff import diff_entries
 
 
 @cli.command("xref")
 @click.argument("old", nargs=1, type=click.Path(exists=True))
 @click.argument("new", nargs=1, type=click.Path(exists=True))
-def xref(old, new):
+@click.option(
+    "--patch",
+    "patch_path",
+    default=None,
+    help="Also write the differences from <OLD> to <NEW> as a JSON Patch.",
+    type=click.Path(dir_okay=False),
+)
+def xref(old, new, patch_path):
     """
     Solve discrepancies between data by cross-reference.
+
+    With '--patch', the differences found are also written as a JSON Patch
+    scoped to changed subtrees (before any history annotation). Items of
+    changed lists are matched by content hash, so that e.g. an insertion is a
+    single operation.
     """
     old_filename = old
     new_filename = new
     old = read_json(old)
     new = read_json(new)
-    for kind in [
+    kinds = [
         "abbreviations",
         "datatypes",
         "fields",
         "components",
         "messages",
-    ]:
+    ]
+    changes = {}
+    ops = []
+    for kind in kinds:
+        (changes[kind], kind_ops) = diff_entries(kind, old[kind], new[kind])
+        ops += kind_ops
+    if patch_path:
+        # Operations refer to entries which are annotated below.
+        with open(patch_path, "w") as f:
+            json.dump(ops, f, indent=DEFAULT_INDENT)
+    version = new["meta"]["version"]
+    for kind in kinds:
 
         def log(op, key):
             return print("-- New [{}] diff for kind {}: {}".format(op, kind, key))
 
-        for (key, value) in new[kind].items():
-            if key not in old[kind]:
+        for (change, key) in changes[kind]:
+            if change == "ADDED":
                 log(" ADDED ", key)
-                value["history"]["added"] = new["version"]
-            elif old[kind][key] != value:
+                new[kind][key]["history"]["added"] = version
+            elif change == "UPDATED":
                 log("UPDATED", key)
-                value["history"]["updated"] = new["version"]
-        for (key, value) in old[kind].items():
-            if key not in new[kind]:
+                new[kind][key]["history"]["updated"] = version
+            else:
                 log("REMOVED", key)
-                old[kind][key]["history"]["removed"] = new["version"]
+                old[kind][key]["history"]["removed"] = version
     with open(old_filename, "w") as f:
         json.dump(old, f, indent=DEFAULT_INDENT)
     print("-- Written to '{}'".format(old_filename))
     with open(new_filename, "w") as f:
         json.dump(new, f, indent=DEFAULT_INDENT)
     print("-- Written to '{}'".format(new_filename))
+    if patch_path:
+        print("-- Written to '{}'".format(patch_path))
@@ -1,12 +1,17 @@
-import nltk
-from nltk.tokenize.treebank import TreebankWordDetokenizer
+import dbm
+import hashlib
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from xml.etree.ElementTree import Element
 
-from .utils import parse_protocol_version
+from .__version__ import __version__
+from .fix_version import FixVersion
 
 
 def link_to_fix_version(v: str):
-    v_parsed = parse_protocol_version(v)
+    v_parsed = FixVersion(v).data
     return "[{}](#/fix-versions/{}/{}/{}/{})".format(
         v, v_parsed["fix"], v_parsed["major"], v_parsed["minor"], v_parsed["sp"],
     )
@@ -40,6 +45,9 @@ def beautify_docs(data, kind: str):
     # additional preprocessing.
     if kind == "AT":
         return data
+    # NLTK is slow to import, so we only do so when needed.
+    import nltk
+
     words = nltk.word_tokenize(data, preserve_line=True)
     # Link references to primitive datatypes.
     if len(words) >= 2 and words[1] == "field":
@@ -62,7 +70,98 @@ def beautify_docs(data, kind: str):
         else:
             i += 1
         i += 1
-    return TreebankWordDetokenizer().detokenize(words)
+    return detokenizer().detokenize(words)
+
+
+@lru_cache(maxsize=None)
+def detokenizer():
+    from nltk.tokenize.treebank import TreebankWordDetokenizer
+
+    return TreebankWordDetokenizer()
+
+
+class BeautifiedDocsCache:
+    """
+    Content-addressed cache of `beautify_docs` results. FIX documentation is
+    highly repetitive across protocol versions, so the same paragraphs get
+    beautified over and over. Results are kept in a bounded in-memory LRU
+    and, if `path` is given, in an on-disk store shared across builds.
+    """
+
+    def __init__(self, maxsize=65536, path=None):
+        self.maxsize = maxsize
+        self.memory = OrderedDict()
+        self.disk = dbm.open(path, "c") if path else None
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
+
+    def key(self, data, kind):
+        # Only abbreviations are treated differently by `beautify_docs`.
+        # Stored results are tied to the FIXtodict version that produced them.
+        prefix = "{}:{}:".format(__version__, kind == "AT")
+        return hashlib.sha1((prefix + data).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        if self.disk is not None and key in self.disk:
+            value = self.disk[key].decode("utf-8")
+            self.remember(key, value)
+            return value
+        return None
+
+    def put(self, key, value):
+        self.remember(key, value)
+        if self.disk is not None:
+            self.disk[key] = value.encode("utf-8")
+
+    def remember(self, key, value):
+        self.memory[key] = value
+        if len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def beautify(self, data, kind: str):
+        key = self.key(data, kind)
+        value = self.get(key)
+        if value is None:
+            value = beautify_docs(data, kind)
+            self.put(key, value)
+        return value
+
+    def beautify_all(self, items, jobs=1):
+        """
+        Beautifies a list of (paragraph, kind) pairs. Cache misses are
+        deduplicated and, if `jobs` isn't 1, computed on a process pool.
+        """
+        keys = [self.key(data, kind) for (data, kind) in items]
+        results = [self.get(key) for key in keys]
+        misses = OrderedDict()
+        for (key, item, result) in zip(keys, items, results):
+            if result is None:
+                misses[key] = item
+        if jobs == 1 or len(misses) < 2:
+            values = [beautify_docs(data, kind) for (data, kind) in misses.values()]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                values = list(
+                    executor.map(
+                        beautify_docs,
+                        [data for (data, _) in misses.values()],
+                        [kind for (_, kind) in misses.values()],
+                        chunksize=256,
+                    )
+                )
+        computed = dict(zip(misses.keys(), values))
+        for (key, value) in computed.items():
+            self.put(key, value)
+        return [
+            computed[key] if result is None else result
+            for (key, result) in zip(keys, results)
+        ]
 
 
 def xml_to_docs(root: Element):
@@ -77,10 +176,24 @@ def xml_to_docs(root: Element):
     return data
 
 
-def markdownify_docs(docs):
+@lru_cache(maxsize=None)
+def default_docs_cache():
+    # Shared by all `markdownify_docs` calls which don't provide a cache, so
+    # that building several versions in a row beautifies each paragraph once.
+    return BeautifiedDocsCache()
+
+
+def markdownify_docs(docs, cache=None, jobs=1):
+    if cache is None:
+        cache = default_docs_cache()
+    # Flatten all paragraphs, so they can be beautified in one batch.
+    items = []
     for (key, val) in docs.items():
         kind = key.split("_")[0]
-        docs[key] = "\n".join([beautify_docs(p, kind) for p in val["paragraphs"]])
+        items += [(p, kind) for p in val["paragraphs"]]
+    paragraphs = iter(cache.beautify_all(items, jobs=jobs))
+    for (key, val) in docs.items():
+        docs[key] = "\n".join([next(paragraphs) for _ in val["paragraphs"]])
     return docs
 
 
@@ -108,12 +221,45 @@ def transform_descriptions(data, f):
     return data
 
 
+def iter_descriptions(data):
+    # Same traversal as `transform_descriptions`, but lazy and read-only.
+    if isinstance(data, dict):
+        for (key, val) in data.items():
+            if key == "description":
+                yield val
+            else:
+                yield from iter_descriptions(val)
+    elif isinstance(data, list):
+        for x in data:
+            yield from iter_descriptions(x)
+
+
+class TypoReplacer:
+    """
+    Replaces all typos in a string in a single pass, using one regular
+    expression compiled out of a {typo: correction} mapping.
+    """
+
+    def __init__(self, typos):
+        self.typos = dict(typos)
+        # Longer typos first, so they take precedence over their prefixes.
+        keys = sorted(self.typos.keys(), key=len, reverse=True)
+        self.regex = re.compile("|".join(re.escape(k) for k in keys)) if keys else None
+
+    def __call__(self, text: str):
+        if self.regex is None:
+            return text
+        return self.regex.sub(lambda m: self.typos[m.group(0)], text)
+
+
 def fix_dict_replace_typos(data, typos):
-    def replace(description):
+    # `typos` can be reused across calls by passing a `TypoReplacer`.
+    if not isinstance(typos, TypoReplacer):
+        typos = TypoReplacer(typos)
+    for description in iter_descriptions(data):
+        if not isinstance(description, dict):
+            continue
         for kind in ["body", "usage", "volume", "elaboration"]:
-            if kind in description and description[kind] is not None:
-                for (old, new) in typos.items():
-                    description[kind] = description[kind].replace(old, new)
-        return description
-
-    return transform_descriptions(data, replace)
+            if description.get(kind) is not None:
+                description[kind] = typos(description[kind])
+    return data
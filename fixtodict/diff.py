@@ -0,0 +1,84 @@
+"""
+Structural diffs between FIXtodict documents, as JSON Patches scoped to the
+subtrees which actually changed.
+"""
+
+import difflib
+import hashlib
+import json
+
+
+def digest(value):
+    """
+    Stable content hash of any JSON value: it doesn't depend on key order.
+    """
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def pointer(parts):
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def diff_values(old, new, parts, ops):
+    """
+    Appends to `ops` JSON Patch operations which turn `old` into `new`.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": pointer(parts + [key])})
+        for (key, value) in new.items():
+            if key not in old:
+                path = pointer(parts + [key])
+                ops.append({"op": "add", "path": path, "value": value})
+            elif old[key] != value:
+                diff_values(old[key], value, parts + [key], ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        diff_lists(old, new, parts, ops)
+    else:
+        ops.append({"op": "replace", "path": pointer(parts), "value": new})
+
+
+def diff_lists(old, new, parts, ops):
+    # Items are matched by content hash, so that e.g. a msg-content inserted
+    # in the middle of `contents` is a single "add" rather than a "replace"
+    # of everything after it. When an operation is applied, the list reads
+    # `new[:j1] + old[i1:]`, hence indices into `new`.
+    matcher = difflib.SequenceMatcher(
+        None, [digest(x) for x in old], [digest(x) for x in new], autojunk=False
+    )
+    for (tag, i1, i2, j1, j2) in matcher.get_opcodes():
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            for k in range(i2 - i1):
+                diff_values(old[i1 + k], new[j1 + k], parts + [j1 + k], ops)
+            continue
+        if tag in ["replace", "delete"]:
+            for _ in range(i1, i2):
+                ops.append({"op": "remove", "path": pointer(parts + [j1])})
+        if tag in ["replace", "insert"]:
+            for j in range(j1, j2):
+                path = pointer(parts + [j])
+                ops.append({"op": "add", "path": path, "value": new[j]})
+
+
+def diff_entries(kind, old, new):
+    """
+    Compares the entries of `kind` in two documents. Returns a list of
+    ("ADDED" | "UPDATED" | "REMOVED", key) changes and the JSON Patch
+    operations which apply them.
+    """
+    changes = []
+    ops = []
+    for (key, value) in new.items():
+        if key not in old:
+            changes.append(("ADDED", key))
+            ops.append({"op": "add", "path": pointer([kind, key]), "value": value})
+        elif old[key] != value:
+            changes.append(("UPDATED", key))
+            diff_values(old[key], value, [kind, key], ops)
+    for key in old:
+        if key not in new:
+            changes.append(("REMOVED", key))
+            ops.append({"op": "remove", "path": pointer([kind, key])})
+    return (changes, ops)
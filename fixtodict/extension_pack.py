@@ -1,5 +1,4 @@
 from xml.etree.ElementTree import Element
-import jsonpatch
 
 from .xml_logic import (
     xml_to_abbreviation,
@@ -22,6 +21,9 @@ class ExtensionPack:
         ["sections", "Sections", "Section", xml_to_section],
     ]
 
+    # Top-level members patched by EPs.
+    KINDS = [recipe[0] for recipe in RESOURCE_RECIPES]
+
     def __init__(self, root: Element):
         self.id = root.get("id")
         self.approved = root.get("approved")
@@ -78,6 +80,8 @@ class ExtensionPack:
         return [{"op": "remove", "path": "/{}/{}".format(resource_kind, key)}]
 
     def to_jsonpatch(self):
+        import jsonpatch
+
         data = []
         # TODO: JSONPatch for metadata.
         for recipe in ExtensionPack.RESOURCE_RECIPES:
@@ -1,4 +1,21 @@
+from functools import total_ordering
+
+
+@total_ordering
 class FixVersion:
+    """
+    A FIX protocol version, optionally with an Extension Pack. Versions
+    compare by protocol, then numerically by major, minor, service pack and
+    EP, with no EP coming before any EP and non-numeric parts after numeric
+    ones.
+    """
+
+    __slots__ = ("data",)
+    # Shared instances, by `key()`.
+    INTERNED = {}
+    # Shared instances, by `parse()` arguments.
+    PARSED = {}
+
     def __init__(self, val: str, ep=None):
         if "_EP" in val:
             val, ep = tuple(val.split("_EP"))
@@ -17,12 +34,110 @@ class FixVersion:
         if ep:
             self.data["ep"] = ep
 
+    def key(self):
+        d = self.data
+        return (d["fix"], d["major"], d["minor"], d["sp"], d.get("ep"))
+
+    def sort_key(self):
+        (fix, major, minor, sp, ep) = self.key()
+        return (fix, part_key(major), part_key(minor), part_key(sp), part_key(ep))
+
+    def interned(self):
+        """
+        Returns the one shared instance equal to this version. History
+        entries all over a repository refer to a handful of versions, so they
+        share instances (and their `data`), which must never be modified.
+        """
+        return FixVersion.INTERNED.setdefault(self.key(), self)
+
+    @classmethod
+    def parse(cls, val: str, ep=None):
+        """
+        Like the constructor, but memoized: it returns interned instances and
+        only parses each distinct string once.
+        """
+        try:
+            return cls.PARSED[(val, ep)]
+        except KeyError:
+            version = cls.PARSED[(val, ep)] = cls(val, ep).interned()
+            return version
+
+    @classmethod
+    def from_data(cls, data: dict):
+        """
+        Returns the interned version described by `data`, e.g. the history
+        of an entry in generated JSON.
+        """
+        ep = data.get("ep")
+        if isinstance(ep, list):
+            # Patched data lists all applied EPs.
+            ep = ep[-1] if ep else None
+        key = (data["fix"], data["major"], data["minor"], data.get("sp", "0"), ep)
+        if key not in cls.INTERNED:
+            version = cls.__new__(cls)
+            version.data = {"fix": key[0], "major": key[1], "minor": key[2]}
+            version.data["sp"] = key[3]
+            if ep:
+                version.data["ep"] = ep
+            cls.INTERNED[key] = version
+        return cls.INTERNED[key]
+
     @classmethod
-    def create_from_xml_attrs(cls, attrs, keyword):
+    def create_from_xml_attrs(cls, attrs, keyword, interned=False):
+        create = cls.parse if interned else cls
         ep = keyword + "EP"
         if keyword in attrs and ep in attrs and attrs[ep] != "-1":
-            return cls(attrs[keyword], attrs[ep])
+            return create(attrs[keyword], attrs[ep])
         elif keyword in attrs:
-            return cls(attrs[keyword])
+            return create(attrs[keyword])
         else:
             return None
+
+    def __eq__(self, other):
+        if not isinstance(other, FixVersion):
+            return NotImplemented
+        return self.sort_key() == other.sort_key()
+
+    def __lt__(self, other):
+        if not isinstance(other, FixVersion):
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
+
+    def __hash__(self):
+        return hash(self.sort_key())
+
+    def __str__(self):
+        d = self.data
+        s = "{}.{}.{}".format(d["fix"].upper(), d["major"], d["minor"])
+        if d["sp"] != "0":
+            s += "SP" + d["sp"]
+        if "ep" in d:
+            s += "_EP" + str(d["ep"])
+        return s
+
+    def __repr__(self):
+        return "FixVersion({!r})".format(str(self))
+
+
+def part_key(s):
+    # Missing parts sort first, then numbers, then anything else by text.
+    if s is None:
+        return (0, 0, "")
+    try:
+        return (1, int(s), "")
+    except ValueError:
+        return (2, 0, s)
+
+
+def fix_version_slug(version: dict):
+    # E.g. "fix-5-0-sp2", as used for output filenames.
+    slug = "{}-{}-{}".format(version["fix"], version["major"], version["minor"])
+    if version.get("sp", "0") != "0":
+        slug += "-sp" + version["sp"]
+    ep = version.get("ep")
+    if isinstance(ep, list):
+        # Patched data lists all applied EPs.
+        ep = ep[-1] if ep else None
+    if ep:
+        slug += "-ep" + str(ep)
+    return slug
@@ -1,13 +1,264 @@
-from jsonpatch import JsonPatch, JsonPatchException
+import copy
+from collections import OrderedDict
+from jsonpatch import (
+    JsonPatch,
+    JsonPatchException,
+    JsonPatchConflict,
+    JsonPatchTestFailed,
+    InvalidJsonPatch,
+)
+from jsonpointer import JsonPointer
 
-from .schema import validate_v1
+from .schema import validate_v1, validate_patched_v1
 
 
-def apply_patch(data, patch: JsonPatch):
-    validate_v1(data)
+def apply_patch(data, patch: JsonPatch, incremental=False):
+    # In incremental mode, `data` is assumed to be valid already and only
+    # patched entries get validated afterwards.
+    if not incremental:
+        validate_v1(data)
     try:
         data = patch.apply(data)
     except Exception as e:
         print(e)
+        return data
+    if incremental:
+        validate_patched_v1(data, patch)
     # TODO: meta and history stuff.
     return data
+
+
+def apply_patches(data, patches, incremental=False):
+    """
+    Applies several JSON Patches in a single pass, in place (see
+    `apply_patches_in_place`), with the same validation as `apply_patch`.
+    """
+    ops = [op for patch in patches for op in getattr(patch, "patch", patch)]
+    if not incremental:
+        validate_v1(data)
+    apply_patches_in_place(data, [ops])
+    if incremental:
+        validate_patched_v1(data, JsonPatch(ops))
+    return data
+
+
+def apply_patches_in_place(data, patches):
+    """
+    Applies a sequence of JSON Patches to `data` without copying it. Patches
+    can be either `jsonpatch.JsonPatch` objects or lists of operations.
+
+    Operations are grouped by the top-level kind they touch (`fields`,
+    `components`, ...) so that each kind's container is resolved only once;
+    the relative order of operations within a kind is preserved. Patches that
+    move or copy values across kinds, or that touch top-level members
+    themselves, are applied sequentially instead.
+
+    Raises `jsonpatch.JsonPatchException` on failure, in which case `data`
+    might be left partially patched.
+    """
+    ops = []
+    for patch in patches:
+        for op in getattr(patch, "patch", patch):
+            try:
+                parts = JsonPointer(op["path"]).parts
+                from_parts = JsonPointer(op["from"]).parts if "from" in op else None
+            except KeyError as e:
+                raise InvalidJsonPatch("Operation is missing {}".format(e))
+            ops.append((op, parts, from_parts))
+    if all(
+        len(parts) >= 2 and (from_parts is None or from_parts[:1] == parts[:1])
+        for (_, parts, from_parts) in ops
+    ):
+        groups = OrderedDict()
+        for (op, parts, from_parts) in ops:
+            groups.setdefault(parts[0], []).append(
+                (op, parts[1:], from_parts[1:] if from_parts else None)
+            )
+        for (kind, kind_ops) in groups.items():
+            container = get_child(data, kind)
+            for (op, parts, from_parts) in kind_ops:
+                apply_op(container, op, parts, from_parts)
+    else:
+        for (op, parts, from_parts) in ops:
+            apply_op(data, op, parts, from_parts)
+    return data
+
+
+def consolidate_patches(patches, kinds):
+    """
+    Merges a sequence of JSON Patches into a single list of operations with
+    the same effect, dropping those superseded by later ones: an "add",
+    "replace" or "remove" overrides earlier operations on the same path and
+    below it, and changes below a value added (or replaced) earlier are
+    folded into that value.
+
+    Only paths under the top-level members in `kinds` are collapsed; other
+    operations are kept as they are. Operations on list items (e.g.
+    `/fields/54/enum/1`), where indices shift, and on top-level members
+    themselves (e.g. `/fields`) are kept and nothing before them is
+    collapsed, as are "move", "copy" and "test" operations.
+    """
+    result = []
+    # Index in `result` of the latest operation on each path, and paths of
+    # such operations by prefix.
+    latest = {}
+    below = {}
+
+    def forget(path):
+        del latest[path]
+        for i in range(1, len(path)):
+            below[path[:i]].discard(path)
+
+    def track(path, i):
+        latest[path] = i
+        for j in range(1, len(path)):
+            below.setdefault(path[:j], set()).add(path)
+
+    for patch in patches:
+        for op in getattr(patch, "patch", patch):
+            kind = op.get("op")
+            path = tuple(JsonPointer(op["path"]).parts)
+            if kind in ["add", "replace", "remove"] and len(path) >= 2:
+                if path[0] not in kinds:
+                    result.append(op)
+                    continue
+            if (
+                kind not in ["add", "replace", "remove"]
+                or len(path) < 2
+                or any(is_list_index(part) for part in path[2:])
+            ):
+                (latest, below) = ({}, {})
+                result.append(op)
+                continue
+            if fold(result, latest, path, op, forget):
+                continue
+            for other in list(below.get(path, [])):
+                result[latest[other]] = None
+                forget(other)
+            previous = latest.get(path)
+            if previous is not None:
+                previous_kind = result[previous]["op"]
+                if previous_kind == "add" and kind == "replace":
+                    result[previous] = dict(result[previous], value=op["value"])
+                    continue
+                if previous_kind == "replace" or kind == "add":
+                    # Adding to an object replaces any existing member.
+                    result[previous] = None
+            track(path, len(result))
+            result.append(op)
+    return [op for op in result if op is not None]
+
+
+def is_list_index(part):
+    # Entry keys (`/fields/54`) are numeric too, so only parts below them
+    # should be checked.
+    return part == "-" or part.isdigit()
+
+
+def fold(result, latest, path, op, forget):
+    # Applies `op` to the value of an earlier "add" or "replace" of one of
+    # its ancestors, if any. That operation isn't tracked anymore if `op`
+    # can't be applied to its value.
+    for i in range(len(path) - 1, 1, -1):
+        previous = latest.get(path[:i])
+        if previous is None:
+            continue
+        target = result[previous]
+        if target["op"] == "remove":
+            return False
+        value = copy.deepcopy(target["value"])
+        try:
+            apply_op(value, op, list(path[i:]), None)
+        except JsonPatchException:
+            forget(path[:i])
+            return False
+        result[previous] = dict(target, value=value)
+        return True
+    return False
+
+
+def apply_op(root, op, parts, from_parts):
+    kind = op.get("op")
+    if kind not in ["add", "remove", "replace", "move", "copy", "test"]:
+        raise InvalidJsonPatch("Unknown operation {!r}".format(kind))
+    if kind in ["add", "replace", "test"] and "value" not in op:
+        raise InvalidJsonPatch("Operation {!r} is missing 'value'".format(kind))
+    if kind in ["move", "copy"] and from_parts is None:
+        raise InvalidJsonPatch("Operation {!r} is missing 'from'".format(kind))
+    if kind == "test":
+        if get_value(root, parts) != op["value"]:
+            raise JsonPatchTestFailed("Test failed at {}".format(op["path"]))
+        return
+    if not parts:
+        raise JsonPatchConflict("Can't replace the whole document in place")
+    if kind == "remove":
+        remove_child(*get_parent(root, parts))
+    elif kind == "add":
+        add_child(*get_parent(root, parts), op["value"])
+    elif kind == "replace":
+        (parent, key) = get_parent(root, parts)
+        # Replacing requires the target to exist.
+        get_child(parent, key)
+        set_child(parent, key, op["value"])
+    elif kind == "move":
+        if parts[: len(from_parts)] == from_parts and parts != from_parts:
+            raise JsonPatchConflict("Can't move a value into its own children")
+        value = remove_child(*get_parent(root, from_parts))
+        add_child(*get_parent(root, parts), value)
+    elif kind == "copy":
+        value = copy.deepcopy(get_value(root, from_parts))
+        add_child(*get_parent(root, parts), value)
+
+
+def get_value(root, parts):
+    for part in parts:
+        root = get_child(root, part)
+    return root
+
+
+def get_parent(root, parts):
+    return (get_value(root, parts[:-1]), parts[-1])
+
+
+def list_index(parent, key, insert=False):
+    if insert and key == "-":
+        return len(parent)
+    try:
+        i = int(key)
+    except ValueError:
+        raise JsonPatchConflict("Invalid list index {!r}".format(key))
+    if i < 0 or i > len(parent) or (i == len(parent) and not insert):
+        raise JsonPatchConflict("List index {} out of range".format(i))
+    return i
+
+
+def get_child(parent, key):
+    if isinstance(parent, list):
+        return parent[list_index(parent, key)]
+    elif isinstance(parent, dict) and key in parent:
+        return parent[key]
+    raise JsonPatchConflict("Can't find {!r}".format(key))
+
+
+def set_child(parent, key, value):
+    if isinstance(parent, list):
+        parent[list_index(parent, key)] = value
+    else:
+        parent[key] = value
+
+
+def add_child(parent, key, value):
+    if isinstance(parent, list):
+        parent.insert(list_index(parent, key, insert=True), value)
+    elif isinstance(parent, dict):
+        parent[key] = value
+    else:
+        raise JsonPatchConflict("Can't add {!r} to a scalar".format(key))
+
+
+def remove_child(parent, key):
+    if isinstance(parent, list):
+        return parent.pop(list_index(parent, key))
+    elif isinstance(parent, dict) and key in parent:
+        return parent.pop(key)
+    raise JsonPatchConflict("Can't find {!r}".format(key))
@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Collects wall time, CPU time, element counts and peak memory allocations
+    of pipeline stages. Pass one as `profiler` to transformation functions,
+    then get a JSON-friendly report with `to_dict()`.
+
+    Memory tracing slows everything down considerably, so times are best
+    taken with `trace_memory=False`.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name, count=None):
+        # Callers can fill in the count once they know it.
+        record = {"name": name, "count": count}
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            (baseline, _) = tracemalloc.get_traced_memory()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall"] = time.perf_counter() - wall
+            record["cpu"] = time.process_time() - cpu
+            if self.trace_memory:
+                (_, peak) = tracemalloc.get_traced_memory()
+                record["peak"] = max(0, peak - baseline)
+                if started_tracing:
+                    tracemalloc.stop()
+            self.stages.append(record)
+
+    def to_dict(self):
+        return {
+            "wall": sum(s["wall"] for s in self.stages),
+            "cpu": sum(s["cpu"] for s in self.stages),
+            "stages": self.stages,
+        }
+
+
+class NullProfiler:
+    """
+    Stand-in for `Profiler` that doesn't record anything.
+    """
+
+    @contextmanager
+    def stage(self, name, count=None):
+        yield {}
+
+
+NULL_PROFILER = NullProfiler()
@@ -20,7 +20,10 @@ from .xml_logic import (
     embed_msg_contents_into_message,
     embed_msg_contents_into_component,
     embed_docs,
+    embed_kinds_into_msg_contents,
+    msg_content_kinds,
 )
+from .xml_logic.records import records_to_dicts
 from .xml_logic.utils import get_fuzzy
 
 
@@ -56,10 +59,10 @@ def transform_basic_repository_v1(
     categories = xml_to_categories(categories)
     components = xml_to_components(components)
     datatypes = xml_to_datatypes(datatypes)
-    enums = xml_to_enums(enums)
+    enums = records_to_dicts(xml_to_enums(enums))
     fields = xml_to_fields(fields)
     messages = xml_to_messages(messages)
-    msg_contents = xml_to_msg_contents(msg_contents)
+    msg_contents = records_to_dicts(xml_to_msg_contents(msg_contents))
     sections = xml_to_sections(sections)
     # Embeddings.
     for val in fields.values():
@@ -69,19 +72,9 @@ def transform_basic_repository_v1(
     for (key, val) in components.items():
         embed_msg_contents_into_component(val, key, msg_contents)
     # Check the kind of content inside messages.
-    for (message_id, msg_contents_by_tag) in msg_contents.items():
-        for element in msg_contents_by_tag:
-            if element["tag"] in fields:
-                element["kind"] = "field"
-            elif element["tag"] in [c["name"] for c in components.values()]:
-                element["kind"] = "component"
-            else:
-                print(
-                    "-- UNKNOWN MSG_CONTENTS with msg. id {} and tag {}".format(
-                        message_id, element["tag"]
-                    ),
-                    file=sys.stderr,
-                )
+    embed_kinds_into_msg_contents(
+        msg_contents, msg_content_kinds(fields, components)
+    )
     return {
         "meta": meta_v1(fix_version),
         "abbreviations": abbreviations,
@@ -1,4 +1,3 @@
-import pkg_resources
 import json
 import os
 from xml.etree import ElementTree
@@ -13,6 +12,8 @@ LEGAL_INFO = (
 
 
 def test_cases(tag):
+    import pkg_resources
+
     data = []
     t_cases = pkg_resources.resource_listdir(
         PKG_NAME, "resources/tests/{}/".format(tag)
@@ -1,14 +1,114 @@
-import pkg_resources
 import json
-import jsonschema
+import pkgutil
+import re
+from functools import lru_cache
+from jsonpointer import JsonPointer
 
-JSON_SCHEMA_V1 = pkg_resources.resource_string(
-    "fixtodict", "resources/schema/v1.json"
-).decode("ascii")
+from .diff import pointer
+
+
+# Top-level kinds of entries.
+KINDS_V1 = [
+    "abbreviations",
+    "datatypes",
+    "sections",
+    "categories",
+    "fields",
+    "components",
+    "messages",
+]
+
+
+@lru_cache(maxsize=None)
+def json_schema_v1():
+    return pkgutil.get_data("fixtodict", "resources/schema/v1.json").decode("ascii")
+
+
+@lru_cache(maxsize=None)
+def validator_v1():
+    # jsonschema is slow to import, so we only do so when needed.
+    import jsonschema
+
+    # Parsing the schema and checking it against its metaschema is expensive,
+    # so it's only done once and the resulting validator is reused.
+    schema = json.loads(json_schema_v1())
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def iter_errors_v1(data):
+    return validator_v1().iter_errors(data)
+
+
+def error_pointer(error):
+    return pointer(error.absolute_path)
 
 
 def validate_v1(data):
-    try:
-        jsonschema.validate(data, json.loads(JSON_SCHEMA_V1))
-    except jsonschema.ValidationError as e:
+    errors = list(iter_errors_v1(data))
+    for e in errors:
+        print(e.message)
+    return errors
+
+
+def patched_entries(patch):
+    """
+    Returns the set of (kind, key) entries touched by a `jsonpatch.JsonPatch`,
+    or None if it touches anything else (e.g. `meta`).
+    """
+    entries = set()
+    for op in patch.patch:
+        for path in [op["path"], op.get("from")]:
+            if path is None:
+                continue
+            parts = JsonPointer(path).parts
+            if len(parts) < 2 or parts[0] not in KINDS_V1:
+                return None
+            entries.add((parts[0], parts[1]))
+    return entries
+
+
+def entry_schemas_v1(kind, key):
+    # Entries are checked against exactly what full validation applies to
+    # them as members of `kind`, so both modes always agree.
+    schema = validator_v1().schema["properties"][kind]
+    schemas = []
+    if key in schema.get("properties", {}):
+        schemas.append(schema["properties"][key])
+    for (pattern, subschema) in schema.get("patternProperties", {}).items():
+        if re.search(pattern, key):
+            schemas.append(subschema)
+    if not schemas and "additionalProperties" in schema:
+        schemas.append(schema["additionalProperties"])
+    return schemas
+
+
+def iter_entry_errors_v1(data, kind, key):
+    validator = validator_v1()
+    for schema in entry_schemas_v1(kind, key):
+        for e in validator.descend(data[kind][key], schema, path=key):
+            e.path.appendleft(kind)
+            yield e
+
+
+def iter_patched_errors_v1(data, patch):
+    """
+    Validates only what `patch` might have changed in `data`, assuming it was
+    valid before the patch got applied.
+    """
+    entries = patched_entries(patch)
+    if entries is None:
+        yield from iter_errors_v1(data)
+        return
+    for (kind, key) in sorted(entries):
+        # Removed entries are gone, nothing left to check.
+        if key in data[kind]:
+            yield from iter_entry_errors_v1(data, kind, key)
+
+
+def validate_patched_v1(data, patch):
+    errors = list(iter_patched_errors_v1(data, patch))
+    for e in errors:
         print(e.message)
+    return errors
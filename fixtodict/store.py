@@ -0,0 +1,165 @@
+"""
+Random-access store for FIXtodict data. Each entry of each top-level member
+(`fields/35`, `messages/D`, `meta/version`...) is serialized as a separate
+JSON document, and an index maps entries to their byte ranges. Readers
+memory-map the file and only deserialize what they look up.
+
+Layout: a magic header, entries one after the other, the JSON-encoded index
+and finally the offset of the index as an 8-byte big-endian integer.
+"""
+
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+MAGIC = b"FIXTODICT-STORE-1\n"
+TRAILER = struct.Struct(">Q")
+
+
+class StoreError(ValueError):
+    pass
+
+
+def write_store(data, f):
+    """
+    Writes `data` to the binary file object `f`, one entry at a time. `f`
+    doesn't need to be seekable.
+    """
+    offset = 0
+
+    def write(b):
+        nonlocal offset
+        f.write(b)
+        offset += len(b)
+
+    def write_entry(value):
+        start = offset
+        write(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        return [start, offset - start]
+
+    write(MAGIC)
+    index = {}
+    for (key, section) in data.items():
+        if isinstance(section, dict):
+            index[key] = {k: write_entry(v) for (k, v) in section.items()}
+        else:
+            index[key] = write_entry(section)
+    index_offset = offset
+    write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+    write(TRAILER.pack(index_offset))
+
+
+def pointer_parts(pointer):
+    # Both "/fields/35" (JSON Pointer, RFC 6901) and "fields/35" are fine.
+    if pointer.startswith("/"):
+        pointer = pointer[1:]
+    if not pointer:
+        return []
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer.split("/")]
+
+
+class Store:
+    """
+    Read-only view over a file written by `write_store`. Lookups raise
+    `KeyError` for missing entries.
+    """
+
+    def __init__(self, path):
+        self.f = open(path, "rb")
+        try:
+            self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file.
+            self.f.close()
+            raise StoreError("'{}' is not a FIXtodict store".format(path))
+        end = len(self.mm) - TRAILER.size
+        if end < len(MAGIC) or self.mm[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise StoreError("'{}' is not a FIXtodict store".format(path))
+        try:
+            (index_offset,) = TRAILER.unpack_from(self.mm, end)
+            if not len(MAGIC) <= index_offset < end:
+                raise ValueError("index offset out of range")
+            self.index = json.loads(self.mm[index_offset:end].decode("utf-8"))
+            if not isinstance(self.index, dict):
+                raise ValueError("index is not an object")
+        except (struct.error, ValueError) as e:
+            # Truncated or corrupt file. JSON and Unicode errors are
+            # `ValueError`s too.
+            self.close()
+            raise StoreError("'{}' is a corrupt FIXtodict store: {}".format(path, e))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.mm.close()
+        self.f.close()
+
+    def keys(self, kind):
+        return list(self.index[kind])
+
+    def entry(self, kind, key):
+        return self.load(self.index[kind][key])
+
+    def get(self, pointer):
+        """
+        Looks up the value at `pointer` (e.g. "/fields/35" or
+        "/messages/D/name"), deserializing as few entries as possible.
+        """
+        parts = pointer_parts(pointer)
+        node = self.index
+        while parts and isinstance(node, dict):
+            node = node[parts.pop(0)]
+        value = self.materialize(node)
+        for part in parts:
+            if isinstance(value, list):
+                try:
+                    value = value[int(part)]
+                except (ValueError, IndexError):
+                    raise KeyError(part)
+            elif isinstance(value, dict):
+                value = value[part]
+            else:
+                raise KeyError(part)
+        return value
+
+    def to_dict(self):
+        return self.materialize(self.index)
+
+    def materialize(self, node):
+        if isinstance(node, dict):
+            return {k: self.materialize(v) for (k, v) in node.items()}
+        return self.load(node)
+
+    def load(self, location):
+        (offset, length) = location
+        return json.loads(self.mm[offset : offset + length].decode("utf-8"))
+
+
+class StoreSection(Mapping):
+    """
+    Read-only mapping over the entries of one top-level member of a store,
+    e.g. `StoreSection(store, "phrases")`. Entries are deserialized on every
+    lookup.
+    """
+
+    def __init__(self, store, kind):
+        self.store = store
+        self.index = store.index[kind]
+
+    def __getitem__(self, key):
+        return self.store.load(self.index[key])
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
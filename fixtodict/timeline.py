@@ -0,0 +1,129 @@
+"""
+Index of how repository entries (`fields/1300`, `messages/D`...) changed
+across FIX protocol versions and Extension Packs.
+"""
+
+import bisect
+import json
+import os
+
+from .diff import digest
+from .fix_version import FixVersion
+from .schema import KINDS_V1
+
+
+def entry_hash(entry):
+    # History is what timelines keep track of, so it's not content.
+    if isinstance(entry, dict):
+        entry = {k: v for (k, v) in entry.items() if k != "history"}
+    return digest(entry)[:16]
+
+
+def expand(events, n):
+    # Content hash of an entry at each of `n` versions.
+    states = [None] * n
+    for (i, (start, digest)) in enumerate(events):
+        end = events[i + 1][0] if i + 1 < len(events) else n
+        states[start:end] = [digest] * (end - start)
+    return states
+
+
+def compress(states):
+    events = []
+    previous = None
+    for (i, digest) in enumerate(states):
+        if digest != previous:
+            events.append([i, digest])
+            previous = digest
+    return events
+
+
+class Timeline:
+    """
+    For every entry, only change events are stored: the index of each
+    version at which its content hash differs from the previous version's,
+    along with the new hash (None once it's been removed). Versions are kept
+    sorted and can be added in any order; adding a version again replaces
+    it. Appending the newest version only looks at the last event of each
+    entry.
+    """
+
+    def __init__(self, versions=None, entries=None):
+        self.versions = versions or []
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        versions = [FixVersion.from_data(v) for v in data["versions"]]
+        return cls(versions, data["entries"])
+
+    def save(self, path):
+        data = {"versions": [v.data for v in self.versions], "entries": self.entries}
+        # Write then rename, so an interrupted update never corrupts the index.
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def add(self, data):
+        """
+        Adds a generated repository to the timeline and returns its version.
+        """
+        version = FixVersion.from_data(data["meta"]["version"])
+        n = len(self.versions)
+        if version in self.versions:
+            (i, replace) = (self.versions.index(version), True)
+        else:
+            (i, replace) = (bisect.bisect(self.versions, version), False)
+        for kind in KINDS_V1:
+            column = {k: entry_hash(v) for (k, v) in data.get(kind, {}).items()}
+            entries = self.entries.setdefault(kind, {})
+            for key in set(entries) | set(column):
+                events = entries.get(key, [])
+                digest = column.get(key)
+                if i == n:
+                    if digest != (events[-1][1] if events else None):
+                        events.append([i, digest])
+                    entries[key] = events
+                    continue
+                states = expand(events, n)
+                if replace:
+                    states[i] = digest
+                else:
+                    states.insert(i, digest)
+                events = compress(states)
+                if events:
+                    entries[key] = events
+                else:
+                    # Only the replaced version had it.
+                    del entries[key]
+        if not replace:
+            self.versions.insert(i, version)
+        return version
+
+    def history(self, kind, key):
+        """
+        Change events of an entry, oldest first, as (version, event, hash)
+        tuples where event is one of "added", "updated" and "removed".
+        """
+        result = []
+        previous = None
+        for (i, digest) in self.entries.get(kind, {}).get(key, []):
+            if digest is None:
+                event = "removed"
+            elif previous is None:
+                event = "added"
+            else:
+                event = "updated"
+            result.append((self.versions[i], event, digest))
+            previous = digest
+        return result
+
+    def versions_of(self, kind, key):
+        """
+        All versions in which an entry exists.
+        """
+        states = expand(self.entries.get(kind, {}).get(key, []), len(self.versions))
+        return [v for (v, digest) in zip(self.versions, states) if digest is not None]
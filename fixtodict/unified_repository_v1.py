@@ -22,26 +22,70 @@ from .xml_logic import (
     embed_msg_contents_into_component,
     embed_docs,
 )
+from .profiling import NULL_PROFILER
 
 
-def transform_unified_repository_v1(root: Element, phrases: Element):
-    abbreviations = xml_to_abbreviations(root.find("abbreviations"))
-    categories = xml_to_categories(root.find("categories"))
-    components = xml_to_components(root.find("components"))
-    datatypes = xml_to_datatypes(root.find("datatypes"))
-    fields = xml_to_fields(root.find("fields"))
-    messages = xml_to_messages(root.find("messages"))
-    sections = xml_to_sections(root.find("sections"))
+# Sections of each `<fix>` element of a Unified repository, along with their
+# converters.
+UNIFIED_REPOSITORY_V1_SECTIONS = [
+    ("abbreviations", xml_to_abbreviations),
+    ("categories", xml_to_categories),
+    ("components", xml_to_components),
+    ("datatypes", xml_to_datatypes),
+    ("fields", xml_to_fields),
+    ("messages", xml_to_messages),
+    ("sections", xml_to_sections),
+]
+
+
+def transform_unified_repository_v1(
+    root: Element, phrases: Element, profiler=NULL_PROFILER
+):
+    with profiler.stage("xml_to_docs_definitions") as stage:
+        phrases = xml_to_docs_definitions(phrases)
+        stage["count"] = len(phrases)
+    return transform_unified_fix_v1(root, phrases, profiler)
+
+
+def iter_unified_repository_v1(
+    fixes, phrases, versions=None, profiler=NULL_PROFILER
+):
+    """
+    Transforms the FIX versions of a Unified repository one after the other,
+    e.g. as `<fix>` elements are streamed out of the file by `XmlStream`, so
+    that the file is read once and only one version is held in memory at a
+    time. `phrases` are docs definitions as returned by
+    `xml_to_docs_definitions`, shared by all versions and never modified.
+    Only versions listed in `versions` are transformed, if given.
+    """
+    for fix in fixes:
+        if versions is None or fix.get("version") in versions:
+            yield transform_unified_fix_v1(fix, phrases, profiler)
+
+
+def transform_unified_fix_v1(root: Element, phrases, profiler=NULL_PROFILER):
+    converted = {}
+    for (kind, xml_to_dict) in UNIFIED_REPOSITORY_V1_SECTIONS:
+        with profiler.stage(xml_to_dict.__name__) as stage:
+            converted[kind] = xml_to_dict(root.find(kind))
+            stage["count"] = len(converted[kind])
+    abbreviations = converted["abbreviations"]
+    categories = converted["categories"]
+    components = converted["components"]
+    datatypes = converted["datatypes"]
+    fields = converted["fields"]
+    messages = converted["messages"]
+    sections = converted["sections"]
     fix_version = FixVersion.create_from_xml_attrs(root.attrib, "version").data
-    phrases = xml_to_docs_definitions(phrases)
     # Embed docstrings into elements.
-    embed_docs(abbreviations, phrases)
-    embed_docs(categories, phrases)
-    embed_docs(components, phrases)
-    embed_docs(datatypes, phrases)
-    embed_docs(fields, phrases)
-    embed_docs(messages, phrases)
-    embed_docs(sections, phrases)
+    with profiler.stage("embed_docs"):
+        embed_docs(abbreviations, phrases)
+        embed_docs(categories, phrases)
+        embed_docs(components, phrases)
+        embed_docs(datatypes, phrases)
+        embed_docs(fields, phrases)
+        embed_docs(messages, phrases)
+        embed_docs(sections, phrases)
     # No other embeddings to worry about. The Unified FIX Repository contains
     # hierarchial data already.
     return {
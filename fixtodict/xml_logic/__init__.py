@@ -25,5 +25,10 @@ from .elem_phrase import (  # NOQA
     xml_to_docs_definitions,  # NOQA
     embed_docs,  # NOQA
 )
-from .elem_msg_content import xml_to_msg_contents, xml_to_msg_content  # NOQA
+from .elem_msg_content import (  # NOQA
+    xml_to_msg_contents,  # NOQA
+    xml_to_msg_content,  # NOQA
+    msg_content_kinds,  # NOQA
+    embed_kinds_into_msg_contents,  # NOQA
+)
 from .elem_section import xml_to_sections, xml_to_section  # NOQA
@@ -1,8 +1,8 @@
 from .utils import xml_to_sorted_dict, xml_get_history, xml_get_docs, get_fuzzy
 
 
-def xml_to_abbreviations(root):
-    return xml_to_sorted_dict(root, xml_to_abbreviation)
+def xml_to_abbreviations(root, sort=True):
+    return xml_to_sorted_dict(root, xml_to_abbreviation, sort)
 
 
 def xml_to_abbreviation(root):
@@ -7,8 +7,8 @@ from .utils import (
 )
 
 
-def xml_to_categories(root):
-    return xml_to_sorted_dict(root, xml_to_category)
+def xml_to_categories(root, sort=True):
+    return xml_to_sorted_dict(root, xml_to_category, sort)
 
 
 def xml_to_category(root):
@@ -7,8 +7,8 @@ from .utils import (
 )
 
 
-def xml_to_components(root):
-    return xml_to_sorted_dict(root, xml_to_component)
+def xml_to_components(root, sort=True):
+    return xml_to_sorted_dict(root, xml_to_component, sort)
 
 
 def xml_to_component(root):
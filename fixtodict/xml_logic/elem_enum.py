@@ -1,31 +1,34 @@
+from .records import EnumValue
 from .utils import (
     xml_to_sorted_dict,
     xml_get_docs,
-    xml_get_history,
-    filter_none,
+    xml_get_history_record,
     get_fuzzy,
 )
 
 
 def xml_to_enums(root):
+    # Enum values are kept as records until they're embedded into fields.
     data = {}
     for child in root:
-        enum = xml_to_enum(child)
-        parent = enum["$parent"]
+        enum = xml_to_enum_record(child)
+        parent = enum.parent
         if parent not in data:
             data[parent] = []
-        del enum["$parent"]
+        enum.parent = None
         data[parent].append(enum)
     return data
 
 
 def xml_to_enum(root):
-    return filter_none(
-        {
-            "$parent": get_fuzzy(root, "tag"),
-            "name": get_fuzzy(root, "symbolicName"),
-            "value": get_fuzzy(root, "value"),
-            "history": xml_get_history(root),
-            "docs": xml_get_docs(root),
-        }
+    return xml_to_enum_record(root).to_dict()
+
+
+def xml_to_enum_record(root):
+    return EnumValue(
+        parent=get_fuzzy(root, "tag"),
+        name=get_fuzzy(root, "symbolicName"),
+        value=get_fuzzy(root, "value"),
+        history=xml_get_history_record(root),
+        docs=xml_get_docs(root),
     )
@@ -8,8 +8,8 @@ from .utils import (
 )
 
 
-def xml_to_fields(root):
-    return xml_to_sorted_dict(root, xml_to_field)
+def xml_to_fields(root, sort=True):
+    return xml_to_sorted_dict(root, xml_to_field, sort)
 
 
 def xml_to_field(root):
@@ -7,8 +7,8 @@ from .utils import (
 )
 
 
-def xml_to_messages(root):
-    return xml_to_sorted_dict(root, xml_to_message)
+def xml_to_messages(root, sort=True):
+    return xml_to_sorted_dict(root, xml_to_message, sort)
 
 
 def xml_to_message(root):
@@ -33,7 +33,12 @@ def xml_to_message(root):
 
 def xml_to_refs(root):
     data = []
-    for child in root.find("structure"):
+    # Basic repository messages have no inline structure; their contents are
+    # embedded later from MsgContents.xml.
+    structure = root.find("structure")
+    if structure is None:
+        return data
+    for child in structure:
         data.append(
             {
                 "id": get_fuzzy(child, "id"),
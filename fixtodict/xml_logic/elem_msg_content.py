@@ -1,31 +1,59 @@
+import sys
+
+from .records import MsgContent
 from .utils import (
     xml_to_sorted_dict,
     xml_get_docs,
-    xml_get_history,
+    xml_get_history_record,
     filter_none,
     get_fuzzy,
 )
 
 
 def xml_to_msg_contents(root):
+    # Msg-contents are kept as records until they're embedded.
     data = {}
     for child in root:
-        elem = xml_to_msg_content(child)
-        parent = elem["$parent"]
+        elem = xml_to_msg_content_record(child)
+        parent = elem.parent
         if parent not in data:
             data[parent] = []
         data[parent].append(elem)
-    return {k: sorted(v, key=lambda x: x["position"]) for (k, v) in data.items()}
+    return {k: sorted(v, key=lambda x: x.position) for (k, v) in data.items()}
 
 
 def xml_to_msg_content(root):
-    return {
-        "$parent": get_fuzzy(root, "ComponentID"),
-        "tag": get_fuzzy(root, "TagText"),
-        "kind": None,
-        "position": float(get_fuzzy(root, "Position")),
-        "optional": not bool(int(get_fuzzy(root, "Reqd"))),
-        "inlined": bool(int(get_fuzzy(root, "Inlined") or "1")),
-        "docs": xml_get_docs(root, body=True),
-        "history": xml_get_history(root),
-    }
+    return xml_to_msg_content_record(root).to_dict()
+
+
+def xml_to_msg_content_record(root):
+    return MsgContent(
+        parent=get_fuzzy(root, "ComponentID"),
+        tag=get_fuzzy(root, "TagText"),
+        kind=None,
+        position=float(get_fuzzy(root, "Position")),
+        optional=not bool(int(get_fuzzy(root, "Reqd"))),
+        inlined=bool(int(get_fuzzy(root, "Inlined") or "1")),
+        docs=xml_get_docs(root, body=True),
+        history=xml_get_history_record(root),
+    )
+
+
+def msg_content_kinds(fields, components):
+    # Fields take precedence over components with the same name.
+    kinds = {c["name"]: "component" for c in components.values()}
+    kinds.update({tag: "field" for tag in fields})
+    return kinds
+
+
+def embed_kinds_into_msg_contents(msg_contents, kinds):
+    for (parent, elements) in msg_contents.items():
+        for element in elements:
+            element["kind"] = kinds.get(element["tag"])
+            if element["kind"] is None:
+                print(
+                    "-- UNKNOWN MSG_CONTENTS with msg. id {} and tag {}".format(
+                        parent, element["tag"]
+                    ),
+                    file=sys.stderr,
+                )
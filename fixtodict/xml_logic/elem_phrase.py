@@ -1,40 +1,40 @@
-from .utils import xml_to_sorted_dict, xml_get_history, filter_none
+from .utils import xml_get_history, filter_none
 
 
 def xml_to_docs_definitions(root):
-    return xml_to_sorted_dict(root, xml_to_doc_definition)
+    # Phrases are only ever looked up by text ID, so there's no need to sort
+    # them. `root` can be an `XmlStream`.
+    return dict(xml_to_doc_definition(c) for c in root)
 
 
 def xml_to_doc_definition(root):
     text_id = root.get("textId", default="")
     kind = text_id[:2]
-    docs = {
-        "description": "",
-        "elaboration": "",
-    }
-    # Abbreviation.
-    if kind != "AT":
-        docs["examples"] = []
+    paragraphs = {"SYNOPSIS": [], "ELABORATION": []}
     for child in root:
-        if ("purpose", "SYNOPSIS") in child.attrib.items():
-            for paragraph in child:
-                docs["description"] += paragraph.text + "\n"
-        if ("purpose", "ELABORATION") in child.attrib.items():
-            for paragraph in child:
-                docs["elaboration"] += paragraph.text + "\n"
-    if docs["description"] == "":
-        del docs["description"]
-    if docs["elaboration"] == "":
-        del docs["elaboration"]
+        purpose = child.get("purpose")
+        if purpose in paragraphs:
+            paragraphs[purpose].extend(p.text + "\n" for p in child)
+    docs = {}
+    if paragraphs["SYNOPSIS"]:
+        docs["description"] = "".join(paragraphs["SYNOPSIS"])
+    if paragraphs["ELABORATION"]:
+        docs["elaboration"] = "".join(paragraphs["ELABORATION"])
+    # Abbreviation.
     if kind == "AT":
         docs["$abbreviationTerm"] = root.find("text").findtext("para")
+    else:
+        docs["examples"] = []
     return (text_id, docs)
 
 
 def embed_docs(data, phrases):
+    # `phrases` is left untouched, so it can be shared by several versions.
     for val in data.values():
-        if "$id" in val["docs"].keys():
-            if val["docs"]["$id"].startswith("AT_"):
-                val["term"] = phrases[val["docs"]["$id"]]["$abbreviationTerm"]
-                del phrases[val["docs"]["$id"]]["$abbreviationTerm"]
-            val["docs"] = phrases[val["docs"]["$id"]]
+        text_id = val["docs"].get("$id")
+        if text_id is not None:
+            docs = phrases[text_id]
+            if text_id.startswith("AT_"):
+                docs = dict(docs)
+                val["term"] = docs.pop("$abbreviationTerm")
+            val["docs"] = docs
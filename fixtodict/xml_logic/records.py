@@ -0,0 +1,96 @@
+from ..fix_version import FixVersion
+
+
+class Record:
+    """
+    Compact, slotted stand-in for the dicts produced by `xml_to_*`
+    converters, used for the most numerous kinds of entries while a
+    repository is being transformed. `to_dict()` gives the same dict the
+    converter would have produced.
+
+    Subclasses list their attributes in `__slots__`, in output order.
+    """
+
+    __slots__ = ()
+    # Output key of attributes, when different from their name.
+    KEYS = {}
+    # Attributes which are left out of dicts when None.
+    OPTIONAL = ()
+
+    def __init__(self, **kwargs):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for (name, value) in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def to_dict(self):
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None and name in self.OPTIONAL:
+                continue
+            data[self.KEYS.get(name, name)] = to_plain(value)
+        return data
+
+
+class History(Record):
+    __slots__ = ("replacement", "added", "updated", "deprecated", "replaced", "issues")
+    OPTIONAL = __slots__
+
+
+class EnumValue(Record):
+    __slots__ = ("parent", "name", "value", "history", "docs")
+    KEYS = {"parent": "$parent"}
+    OPTIONAL = __slots__
+
+
+class MsgContent(Record):
+    __slots__ = (
+        "parent",
+        "tag",
+        "kind",
+        "position",
+        "optional",
+        "inlined",
+        "docs",
+        "history",
+    )
+    KEYS = {"parent": "$parent"}
+
+
+def to_plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    elif isinstance(value, FixVersion):
+        # Interned versions are shared by many records, but output is
+        # expected to be safe to modify in place.
+        return dict(value.data)
+    return value
+
+
+def records_to_dicts(grouped):
+    """
+    Converts a dict of lists of records, as returned by `xml_to_enums` and
+    `xml_to_msg_contents`, into plain data.
+    """
+    return {k: [to_plain(r) for r in v] for (k, v) in grouped.items()}
+
+
+def records_to_dicts_in_place(grouped):
+    """
+    Like `records_to_dicts`, but replaces each list of records in `grouped`
+    as it goes, so that records can be freed before all dicts are built.
+    """
+    for (key, records) in grouped.items():
+        grouped[key] = [to_plain(r) for r in records]
+    return grouped
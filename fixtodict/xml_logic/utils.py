@@ -1,20 +1,61 @@
-from natsort import natsorted
+import re
+import unicodedata
+from functools import lru_cache
+from operator import methodcaller
 
 from ..fix_version import FixVersion
+from .records import History
 
 
-def get_fuzzy(elem, *keys):
-    for key in list(keys):
+# Direct accessors for `get_fuzzy`, by element tag and candidate keys. Any
+# given XML flavor spells and places an attribute the same way on all
+# elements of a kind, so the first successful lookup tells us where to look
+# for all the others. Only lookups of the first key are cached: siblings
+# might have a key of higher priority than the one that matched.
+ACCESSORS = {}
+
+# All lookups `get_fuzzy` might try for a key, by priority.
+CANDIDATES = {}
+
+
+def key_candidates(key):
+    if key not in CANDIDATES:
         lower = key[0].lower() + key[1:]
         upper = key[0].upper() + key[1:]
-        result = (
-            elem.findtext(lower)
-            or elem.findtext(upper)
-            or elem.get(lower)
-            or elem.get(upper)
+        CANDIDATES[key] = (
+            methodcaller("findtext", lower),
+            methodcaller("findtext", upper),
+            methodcaller("get", lower),
+            methodcaller("get", upper),
         )
+    return CANDIDATES[key]
+
+
+def probe_fuzzy(elem, keys):
+    for (i, key) in enumerate(keys):
+        for accessor in key_candidates(key):
+            result = accessor(elem)
+            if result:
+                return (result, accessor if i == 0 else None)
+        # Empty attribute values are still returned, but not worth caching.
         if result is not None:
+            return (result, None)
+    return (None, None)
+
+
+def get_fuzzy(elem, *keys):
+    plan = (elem.tag, keys)
+    accessor = ACCESSORS.get(plan)
+    if accessor is not None:
+        result = accessor(elem)
+        if result:
             return result
+    # Miss, either because we've never seen this kind of element or because
+    # it's spelled differently than its siblings. Fall back to probing.
+    (result, accessor) = probe_fuzzy(elem, keys)
+    if accessor is not None:
+        ACCESSORS[plan] = accessor
+    return result
 
 
 def filter_none(data):
@@ -36,23 +77,81 @@ def xml_get_docs(
 
 
 def xml_get_history(root, replaced=False):
-    data = {}
+    return xml_get_history_record(root, replaced).to_dict()
+
+
+def xml_get_history_record(root, replaced=False):
+    history = History()
     keywords = ["added", "updated", "deprecated"]
     if replaced:
         keywords.append("replaced")
-        if root.get("ReplacedByField") is not None:
-            data["replacement"] = root.get("ReplacedByField")
+        history.replacement = root.get("ReplacedByField")
     for keyword in keywords:
-        version = FixVersion.create_from_xml_attrs(root.attrib, keyword)
+        version = FixVersion.create_from_xml_attrs(
+            root.attrib, keyword, interned=True
+        )
         if version is not None:
-            data[keyword] = version.data
+            setattr(history, keyword, version)
     if root.get("issue"):
-        data["issues"] = [root.get("issue")]
-    return filter_none(data)
+        history.issues = [root.get("issue")]
+    return history
+
+
+# Natural sort keys, by key. The same keys (tags, names...) come up over and
+# over again across files and versions.
+NATURAL_KEYS = {}
+
+DIGITS = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=None)
+def natural_keygen():
+    from natsort import natsort_keygen
+
+    return natsort_keygen()
+
+
+def natural_key(key):
+    try:
+        return NATURAL_KEYS[key]
+    except KeyError:
+        pass
+    if isinstance(key, str):
+        value = natural_str_key(key)
+    else:
+        value = natural_keygen()(key)
+    NATURAL_KEYS[key] = value
+    return value
+
+
+def natural_str_key(key):
+    # Same as natsort's default keys: text and numbers alternate, starting
+    # with text. Importing natsort (and, through it, pkg_resources) costs more
+    # time and memory than sorting a whole repository, so it's only done for
+    # keys which aren't strings.
+    if not key:
+        return ()
+    parts = DIGITS.split(unicodedata.normalize("NFD", key))
+    return tuple(
+        int(part) if i % 2 else part
+        for (i, part) in enumerate(parts)
+        if part or i == 0
+    )
 
 
-def xml_to_sorted_dict(root, f):
+def xml_to_sorted_dict(root, f, sort=True):
+    """
+    Converts children of `root` with `f`, which returns key-value pairs, into
+    a dict in natural order of keys (e.g. "2" before "10"). Only keys are
+    compared. With `sort=False`, document order is kept instead.
+    """
     if root is None:
         root = []
-    data = natsorted([f(c) for c in root])
+    data = [f(c) for c in root]
+    if sort:
+        keys = [natural_key(k) for (k, _) in data]
+        # Sources are often sorted already.
+        if any(a > b for (a, b) in zip(keys, keys[1:])):
+            order = sorted(range(len(data)), key=keys.__getitem__)
+            data = [data[i] for i in order]
     return {k: v for (k, v) in data}
@@ -50,6 +50,7 @@ setup(
         "jsonpatch==1.25",
         "jsonschema==3.2.0",
     ],
+    extras_require={"msgpack": ["msgpack"]},
     entry_points="""
     [console_scripts]
     fixtodict=fixtodict.cli:cli
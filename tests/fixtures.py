@@ -0,0 +1,51 @@
+"""
+Data shared by several test modules.
+"""
+
+import os
+import tempfile
+
+from fixtodict.cli.repo import build_basic_repository
+
+# A tiny "Basic" FIX Repository.
+FILES = {
+    "Messages.xml": """<Messages version="FIX.4.4">
+        <Message added="FIX.4.0"><ComponentID>1</ComponentID><MsgType>D</MsgType>
+        <Name>NewOrderSingle</Name><CategoryID>SingleGeneralOrderHandling</CategoryID>
+        <SectionID>Trade</SectionID><NotReqXML>0</NotReqXML>
+        <Description>New order.</Description></Message>
+    </Messages>""",
+    "Fields.xml": """<Fields version="FIX.4.4">
+        <Field added="FIX.2.7"><Tag>55</Tag><Name>Symbol</Name><Type>String</Type>
+        <Description>Ticker.</Description></Field>
+        <Field added="FIX.2.7"><Tag>54</Tag><Name>Side</Name><Type>char</Type>
+        <Description>Side.</Description></Field>
+    </Fields>""",
+    "Datatypes.xml": """<Datatypes version="FIX.4.4">
+        <Datatype added="FIX.4.2"><Name>Length</Name><BaseType>int</BaseType>
+        <Description>Length.</Description><Example>Length=3</Example></Datatype>
+    </Datatypes>""",
+    "Enums.xml": """<Enums version="FIX.4.4">
+        <Enum added="FIX.2.7"><Tag>54</Tag><Value>1</Value>
+        <SymbolicName>Buy</SymbolicName><Description>Buy.</Description></Enum>
+    </Enums>""",
+    "MsgContents.xml": """<MsgContents version="FIX.4.4">
+        <MsgContent added="FIX.4.0"><ComponentID>1</ComponentID><TagText>54</TagText>
+        <Indent>0</Indent><Position>2</Position><Reqd>1</Reqd></MsgContent>
+        <MsgContent added="FIX.4.0"><ComponentID>1</ComponentID><TagText>55</TagText>
+        <Indent>0</Indent><Position>1</Position><Reqd>1</Reqd></MsgContent>
+    </MsgContents>""",
+}
+
+
+def write_basic_repository(path):
+    for (filename, content) in FILES.items():
+        with open(os.path.join(path, filename), "w") as f:
+            f.write(content)
+
+
+def basic_repository(**kwargs):
+    # Built from `FILES`, as 'fixtodict repo' would.
+    with tempfile.TemporaryDirectory() as path:
+        write_basic_repository(path)
+        return build_basic_repository(path, **kwargs)
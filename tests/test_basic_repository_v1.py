@@ -1,7 +1,31 @@
+import json
+import tempfile
 import unittest
 from fixtodict.basic_repository_v1 import transform_basic_repository_v1
+from fixtodict.cli.repo import build_basic_repository
 from fixtodict.resources import test_cases
+from tests.fixtures import write_basic_repository
 
 
 class TestBasicRepository(unittest.TestCase):
-    pass
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        write_basic_repository(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def build(self, **kwargs):
+        data = build_basic_repository(self.dir.name, **kwargs)
+        del data["meta"]["fixtodict"]["timestamp"]
+        return json.dumps(data)
+
+    def test_build(self):
+        data = json.loads(self.build())
+        self.assertEqual(data["fields"]["54"]["name"], "Side")
+        self.assertEqual(
+            [c["tag"] for c in data["messages"]["D"]["contents"]], ["55", "54"]
+        )
+
+    def test_parallel(self):
+        self.assertEqual(self.build(jobs=2), self.build())
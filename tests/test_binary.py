@@ -0,0 +1,37 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from fixtodict.binary import write_msgpack, read_msgpack
+from tests.fixtures import basic_repository
+
+try:
+    import msgpack  # NOQA
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+@unittest.skipUnless(HAS_MSGPACK, "msgpack is not installed")
+class TestMsgpack(unittest.TestCase):
+    def test_round_trip(self):
+        data = basic_repository()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.msgpack")
+            with open(path, "wb") as f:
+                write_msgpack(data, f)
+            loaded = read_msgpack(path)
+        # Same as JSON output, down to float positions and nested lists.
+        self.assertEqual(loaded, json.loads(json.dumps(data)))
+        self.assertIsInstance(
+            loaded["messages"]["D"]["contents"][0]["position"], float
+        )
+
+    def test_same_as_one_shot(self):
+        data = basic_repository()
+        f = io.BytesIO()
+        write_msgpack(data, f)
+        self.assertEqual(f.getvalue(), msgpack.packb(data, use_bin_type=True))
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from fixtodict.cache import SourceCache
+
+
+class TestSourceCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.dir.name, "Fields.xml")
+        with open(self.src, "w") as f:
+            f.write("<Fields/>")
+        self.cache = SourceCache(os.path.join(self.dir.name, "cache"))
+        self.calls = 0
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def convert(self):
+        self.calls += 1
+        return ("FIX.4.4", {"1": {"name": "Account"}})
+
+    def test_hit(self):
+        first = self.cache.load("fields", self.src, self.convert)
+        second = self.cache.load("fields", self.src, self.convert)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_changed_file(self):
+        self.cache.load("fields", self.src, self.convert)
+        with open(self.src, "w") as f:
+            f.write("<Fields></Fields>")
+        self.cache.load("fields", self.src, self.convert)
+        self.assertEqual(self.calls, 2)
+
+    def test_missing_file(self):
+        missing = os.path.join(self.dir.name, "Sections.xml")
+        self.cache.load("sections", missing, self.convert)
+        self.cache.load("sections", missing, self.convert)
+        self.assertEqual(self.calls, 2)
+
+
+class TestStoreCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.dir.name, "phrases.xml")
+        with open(self.src, "w") as f:
+            f.write("<phrases/>")
+        self.cache = SourceCache(os.path.join(self.dir.name, "cache"))
+        self.calls = 0
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def convert(self):
+        self.calls += 1
+        return {"FIELD_1": {"description": "Account mnemonic.\n"}}
+
+    def test_hit(self):
+        first = self.cache.load_store("phrases", self.src, self.convert)
+        second = self.cache.load_store("phrases", self.src, self.convert)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(dict(second), self.convert())
+        self.assertEqual(first["FIELD_1"], second["FIELD_1"])
+        self.assertNotIn("FIELD_2", second)
+        first.store.close()
+        second.store.close()
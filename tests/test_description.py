@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from fixtodict.description import (
+    BeautifiedDocsCache,
+    TypoReplacer,
+    default_docs_cache,
+    fix_dict_replace_typos,
+    markdownify_docs,
+)
+
+
+def fake_beautify_docs(data, kind):
+    # Module-level, so that it can be sent to worker processes.
+    return data if kind == "AT" else data.upper()
+
+
+@mock.patch("fixtodict.description.beautify_docs", new=fake_beautify_docs)
+class TestBeautifiedDocsCache(unittest.TestCase):
+    def test_memoized(self):
+        cache = BeautifiedDocsCache()
+        with mock.patch(
+            "fixtodict.description.beautify_docs", wraps=fake_beautify_docs
+        ) as beautify_docs:
+            self.assertEqual(cache.beautify("a", "FD"), "A")
+            self.assertEqual(cache.beautify("a", "MT"), "A")
+            self.assertEqual(cache.beautify("a", "AT"), "a")
+        self.assertEqual(beautify_docs.call_count, 2)
+
+    def test_bounded(self):
+        cache = BeautifiedDocsCache(maxsize=2)
+        for data in ["a", "b", "a", "c"]:
+            cache.beautify(data, "FD")
+        self.assertIsNotNone(cache.get(cache.key("a", "FD")))
+        self.assertIsNone(cache.get(cache.key("b", "FD")))
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "docs")
+            cache = BeautifiedDocsCache(path=path)
+            cache.beautify("a", "FD")
+            cache.close()
+            cache = BeautifiedDocsCache(path=path)
+            self.assertEqual(cache.get(cache.key("a", "FD")), "A")
+            cache.close()
+
+    def test_beautify_all(self):
+        cache = BeautifiedDocsCache()
+        cache.beautify("b", "FD")
+        items = [("a", "FD"), ("b", "FD"), ("a", "FD"), ("c", "AT")]
+        with mock.patch(
+            "fixtodict.description.beautify_docs", wraps=fake_beautify_docs
+        ) as beautify_docs:
+            self.assertEqual(cache.beautify_all(items), ["A", "B", "A", "c"])
+        # Misses are only computed once.
+        self.assertEqual(beautify_docs.call_count, 2)
+        self.assertEqual(cache.get(cache.key("c", "AT")), "c")
+
+    def test_beautify_all_jobs(self):
+        items = [("a", "FD"), ("b", "FD"), ("a", "FD"), ("c", "AT")]
+        cache = BeautifiedDocsCache()
+        self.assertEqual(cache.beautify_all(items, jobs=2), ["A", "B", "A", "c"])
+        self.assertEqual(cache.get(cache.key("b", "FD")), "B")
+
+    def test_markdownify_docs(self):
+        docs = {
+            "FD_1": {"paragraphs": ["a", "b"]},
+            "AT_2": {"paragraphs": ["c"]},
+            "FD_3": {"paragraphs": ["b", "c", "d"]},
+        }
+        cache = BeautifiedDocsCache()
+        self.assertEqual(
+            markdownify_docs(docs, cache),
+            {"FD_1": "A\nB", "AT_2": "c", "FD_3": "B\nC\nD"},
+        )
+
+    def test_default_cache(self):
+        markdownify_docs({"FD_1": {"paragraphs": ["shared"]}})
+        key = default_docs_cache().key("shared", "FD")
+        self.assertEqual(default_docs_cache().get(key), "SHARED")
+
+
+class TestTypos(unittest.TestCase):
+    def test_longest_match(self):
+        replace = TypoReplacer({"Ord": "Order", "OrdQty": "OrderQty"})
+        self.assertEqual(replace("OrdQty of Ord"), "OrderQty of Order")
+
+    def test_single_pass(self):
+        replace = TypoReplacer({"a": "b", "b": "c"})
+        self.assertEqual(replace("ab"), "bc")
+        self.assertEqual(TypoReplacer({})("ab"), "ab")
+
+    def test_nested(self):
+        data = {
+            "fields": {
+                "1": {"description": {"body": "teh", "usage": "teh teh"}},
+                "2": {"enum": [{"description": {"elaboration": "teh"}}]},
+            },
+            "messages": [{"description": {"body": None}}],
+            "body": "teh",
+        }
+        fix_dict_replace_typos(data, {"teh": "the"})
+        self.assertEqual(
+            data["fields"]["1"]["description"], {"body": "the", "usage": "the the"}
+        )
+        self.assertEqual(
+            data["fields"]["2"]["enum"][0]["description"], {"elaboration": "the"}
+        )
+        self.assertEqual(data["messages"][0]["description"], {"body": None})
+        # Only descriptions are affected.
+        self.assertEqual(data["body"], "teh")
+
+    def test_non_dict_descriptions(self):
+        data = {"a": {"description": "teh"}, "b": {"description": None}}
+        fix_dict_replace_typos(data, TypoReplacer({"teh": "the"}))
+        self.assertEqual(
+            data, {"a": {"description": "teh"}, "b": {"description": None}}
+        )
@@ -0,0 +1,83 @@
+import copy
+import unittest
+
+from fixtodict.diff import diff_entries, digest
+from fixtodict.patch import apply_patches_in_place
+
+OLD = {
+    "fields": {
+        "1": {"name": "Account", "docs": {"description": "Old."}},
+        "35": {"name": "MsgType", "enum": [{"value": "0"}, {"value": "1"}]},
+        "a/b": {"name": "Escaped"},
+    },
+    "messages": {
+        "D": {"name": "NewOrderSingle", "contents": [{"tag": "11"}, {"tag": "55"}]},
+        "E": {"name": "NewOrderList"},
+    },
+}
+
+NEW = {
+    "fields": {
+        "1": {"name": "Account", "docs": {"description": "New."}},
+        "35": {"name": "MsgType", "enum": [{"value": "0"}]},
+        "a/b": {"name": "Escaped", "datatype": "String"},
+        "55": {"name": "Symbol"},
+    },
+    "messages": {
+        "D": {
+            "name": "NewOrderSingle",
+            "contents": [{"tag": "11"}, {"tag": "54"}, {"tag": "55"}],
+        },
+    },
+}
+
+
+class TestDiff(unittest.TestCase):
+    def test_hashes(self):
+        self.assertEqual(
+            digest({"a": [1, "1"], "b": None}), digest({"b": None, "a": [1, "1"]})
+        )
+        self.assertNotEqual(digest([1]), digest(["1"]))
+        self.assertNotEqual(digest({"a": 1}), digest({"b": 1}))
+
+    def test_changes(self):
+        (changes, _) = diff_entries("fields", OLD["fields"], NEW["fields"])
+        self.assertEqual(
+            changes,
+            [("UPDATED", "1"), ("UPDATED", "35"), ("UPDATED", "a/b"), ("ADDED", "55")],
+        )
+        (changes, _) = diff_entries("messages", OLD["messages"], NEW["messages"])
+        self.assertEqual(changes, [("UPDATED", "D"), ("REMOVED", "E")])
+
+    def test_scoped_patch(self):
+        (_, ops) = diff_entries("fields", OLD["fields"], NEW["fields"])
+        self.assertEqual(
+            [(op["op"], op["path"]) for op in ops],
+            [
+                ("replace", "/fields/1/docs/description"),
+                ("remove", "/fields/35/enum/1"),
+                ("add", "/fields/a~1b/datatype"),
+                ("add", "/fields/55"),
+            ],
+        )
+
+    def test_list_insertion(self):
+        (_, ops) = diff_entries("messages", OLD["messages"], NEW["messages"])
+        self.assertEqual(
+            [(op["op"], op["path"]) for op in ops],
+            [
+                ("add", "/messages/D/contents/1"),
+                ("remove", "/messages/E"),
+            ],
+        )
+
+    def test_patch_applies(self):
+        ops = []
+        for kind in ["fields", "messages"]:
+            ops += diff_entries(kind, OLD[kind], NEW[kind])[1]
+        data = copy.deepcopy(OLD)
+        apply_patches_in_place(data, [ops])
+        self.assertEqual(data, NEW)
+
+    def test_unchanged(self):
+        self.assertEqual(diff_entries("fields", OLD["fields"], OLD["fields"]), ([], []))
@@ -0,0 +1,22 @@
+import unittest
+from fixtodict.xml_logic import msg_content_kinds, embed_kinds_into_msg_contents
+
+
+class TestMsgContentKinds(unittest.TestCase):
+    def test_kinds(self):
+        kinds = msg_content_kinds(
+            {"1": {"name": "Account"}, "55": {"name": "Symbol"}},
+            {"1001": {"name": "Instrument"}},
+        )
+        self.assertEqual(kinds["55"], "field")
+        self.assertEqual(kinds["Instrument"], "component")
+        self.assertNotIn("Account", kinds)
+
+    def test_embed(self):
+        msg_contents = {"D": [{"tag": "55", "kind": None}, {"tag": "Instrument"}]}
+        embed_kinds_into_msg_contents(
+            msg_contents, {"55": "field", "Instrument": "component"}
+        )
+        self.assertEqual(
+            [c["kind"] for c in msg_contents["D"]], ["field", "component"]
+        )
@@ -0,0 +1,30 @@
+import unittest
+from xml.etree.ElementTree import fromstring
+
+from fixtodict.xml_logic import xml_to_docs_definitions
+
+PHRASES_XML = """
+<phrases>
+  <phrase textId="FIELD_2">
+    <text purpose="SYNOPSIS"><para>First.</para><para>Second.</para></text>
+    <text purpose="ELABORATION"><para>More.</para></text>
+  </phrase>
+  <phrase textId="FIELD_1"><text purpose="ELABORATION"><para>Only.</para></text></phrase>
+  <phrase textId="AT_Acct"><text purpose="SYNOPSIS"><para>Account</para></text></phrase>
+</phrases>
+"""
+
+
+class TestDocsDefinitions(unittest.TestCase):
+    def test_definitions(self):
+        phrases = xml_to_docs_definitions(fromstring(PHRASES_XML))
+        self.assertEqual(list(phrases), ["FIELD_2", "FIELD_1", "AT_Acct"])
+        self.assertEqual(
+            phrases["FIELD_2"],
+            {"description": "First.\nSecond.\n", "elaboration": "More.\n", "examples": []},
+        )
+        self.assertEqual(phrases["FIELD_1"], {"elaboration": "Only.\n", "examples": []})
+        self.assertEqual(
+            phrases["AT_Acct"],
+            {"description": "Account\n", "$abbreviationTerm": "Account"},
+        )
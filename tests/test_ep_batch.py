@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from fixtodict.cli.ep_batch import find_extension_packs, read_extension_pack_patch
+
+EPS = {
+    "EP97": """<ExtensionPack id="97"><Fields><Inserts>
+        <Field added="FIX.5.0SP2" addedEP="97"><Tag>5000</Tag><Name>New</Name>
+        <Type>int</Type><Description>New.</Description></Field>
+        </Inserts></Fields></ExtensionPack>""",
+    "EP98": "<ExtensionPack",
+    "EP99": '<ExtensionPack id="x"/>',
+}
+
+
+class TestEpBatch(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        for (name, content) in EPS.items():
+            os.mkdir(os.path.join(self.dir.name, name))
+            with open(os.path.join(self.dir.name, name, name + ".xml"), "w") as f:
+                f.write(content)
+        os.mkdir(os.path.join(self.dir.name, "EP100"))
+        os.mkdir(os.path.join(self.dir.name, "other"))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_read(self):
+        dirs = sorted(find_extension_packs(self.dir.name))
+        results = [read_extension_pack_patch(d) for d in dirs]
+        self.assertTrue(results[0].startswith("No Extension Pack found"))
+        (ep_id, _, ops) = results[1]
+        self.assertEqual(ep_id, 97)
+        self.assertEqual(ops[0]["path"], "/fields/5000")
+        self.assertTrue(results[2].startswith("Invalid XML file"))
+        self.assertTrue(results[3].startswith("Invalid EP id"))
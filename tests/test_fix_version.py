@@ -1,7 +1,7 @@
 import unittest
 from xml.etree import ElementTree
 
-from fixtodict.fix_version import FixVersion
+from fixtodict.fix_version import FixVersion, fix_version_slug
 
 
 class TestFixVersionFromString(unittest.TestCase):
@@ -61,3 +61,72 @@ class TestFixVersionFromXML(unittest.TestCase):
             xml_string_to_version(data, "added"),
             {"fix": "fix", "major": "4", "minor": "4", "sp": "0"},
         )
+
+
+class TestFixVersionSlug(unittest.TestCase):
+    def test_40(self):
+        self.assertEqual(fix_version_slug(FixVersion("FIX.4.0").data), "fix-4-0")
+
+    def test_50SP2EP254(self):
+        version = FixVersion("FIX.5.0SP2", ep="254")
+        self.assertEqual(fix_version_slug(version.data), "fix-5-0-sp2-ep254")
+
+
+class TestFixVersionOrdering(unittest.TestCase):
+    def test_sort(self):
+        versions = [
+            FixVersion("FIX.5.0SP2", "254"),
+            FixVersion("FIX.4.4"),
+            FixVersion("FIX.5.0SP2"),
+            FixVersion("FIX.5.0SP1", "97"),
+            FixVersion("FIX.5.0SP2", "97"),
+            FixVersion("FIX.5.0"),
+        ]
+        self.assertEqual(
+            [str(v) for v in sorted(versions)],
+            [
+                "FIX.4.4",
+                "FIX.5.0",
+                "FIX.5.0SP1_EP97",
+                "FIX.5.0SP2",
+                "FIX.5.0SP2_EP97",
+                "FIX.5.0SP2_EP254",
+            ],
+        )
+
+    def test_compare(self):
+        self.assertTrue(
+            FixVersion("FIX.5.0SP2_EP200") > FixVersion("FIX.5.0SP1", "200")
+        )
+        self.assertTrue(FixVersion("FIX.4.2") <= FixVersion("FIX.4.10"))
+        self.assertEqual(FixVersion("fix.4.4"), FixVersion("FIX.4.4"))
+        self.assertNotEqual(FixVersion("FIX.4.4"), FixVersion("FIX.4.4", "1"))
+
+    def test_non_numeric(self):
+        bad = FixVersion("FIX.5.0SP2", "abc")
+        self.assertNotEqual(bad, FixVersion("FIX.5.0SP2"))
+        self.assertNotEqual(hash(bad), hash(FixVersion("FIX.5.0SP2")))
+        self.assertEqual(bad, FixVersion("FIX.5.0SP2", "abc"))
+        self.assertTrue(FixVersion("FIX.5.0SP2", "254") < bad)
+
+    def test_from_data(self):
+        data = {"fix": "fix", "major": "5", "minor": "0", "sp": "2"}
+        data["ep"] = ["97", "254"]
+        self.assertEqual(FixVersion.from_data(data), FixVersion("FIX.5.0SP2", "254"))
+        version = FixVersion("FIX.5.0SP1", "97")
+        self.assertEqual(FixVersion.from_data(version.data), version)
+
+
+class TestFixVersionParse(unittest.TestCase):
+    def test_memoized(self):
+        version = FixVersion.parse("FIX.5.0SP2", "97")
+        self.assertIs(FixVersion.parse("FIX.5.0SP2", "97"), version)
+        self.assertIs(FixVersion.parse("FIX.5.0SP2_EP97"), version)
+        self.assertEqual(FixVersion.parse("FIX.4.4").data, FixVersion("FIX.4.4").data)
+
+    def test_xml_attrs(self):
+        attrs = {"added": "FIX.4.4", "updated": "FIX.5.0SP1", "updatedEP": "97"}
+        a = FixVersion.create_from_xml_attrs(attrs, "updated", interned=True)
+        b = FixVersion.create_from_xml_attrs(dict(attrs), "updated", interned=True)
+        self.assertIs(a, b)
+        self.assertIsNot(FixVersion.create_from_xml_attrs(attrs, "updated"), a)
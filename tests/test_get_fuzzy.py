@@ -0,0 +1,33 @@
+import unittest
+from xml.etree import ElementTree
+
+from fixtodict.xml_logic.utils import get_fuzzy
+
+
+class TestGetFuzzy(unittest.TestCase):
+    def test_child_and_attribute(self):
+        elem = ElementTree.fromstring('<Field tag="1"><Name>Account</Name></Field>')
+        self.assertEqual(get_fuzzy(elem, "name"), "Account")
+        self.assertEqual(get_fuzzy(elem, "id", "tag"), "1")
+
+    def test_falls_back_on_different_spelling(self):
+        first = ElementTree.fromstring(
+            "<Component><ComponentID>1</ComponentID></Component>"
+        )
+        second = ElementTree.fromstring('<Component id="2"></Component>')
+        self.assertEqual(get_fuzzy(first, "id", "ComponentID"), "1")
+        self.assertEqual(get_fuzzy(second, "id", "ComponentID"), "2")
+        self.assertEqual(get_fuzzy(first, "id", "ComponentID"), "1")
+
+    def test_key_priority(self):
+        first = ElementTree.fromstring("<Category><Name>N1</Name></Category>")
+        second = ElementTree.fromstring(
+            "<Category><CategoryID>C2</CategoryID><Name>N2</Name></Category>"
+        )
+        self.assertEqual(get_fuzzy(first, "Id", "CategoryID", "Name"), "N1")
+        self.assertEqual(get_fuzzy(second, "Id", "CategoryID", "Name"), "C2")
+
+    def test_missing(self):
+        elem = ElementTree.fromstring("<MsgContent><Inlined></Inlined></MsgContent>")
+        self.assertIsNone(get_fuzzy(elem, "Inlined"))
+        self.assertIsNone(get_fuzzy(elem, "Position"))
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import unittest
+
+# Slow to import, and not needed by every subcommand.
+HEAVY_MODULES = ["nltk", "jsonschema", "jsonpatch", "pkg_resources", "natsort"]
+
+
+def imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+class TestImportTime(unittest.TestCase):
+    def assertNoHeavyImports(self, code):
+        modules = imported_modules(code)
+        self.assertEqual([m for m in HEAVY_MODULES if m in modules], [])
+
+    def test_package(self):
+        self.assertNoHeavyImports("import fixtodict")
+
+    def test_validate_help(self):
+        self.assertNoHeavyImports(
+            "from fixtodict.cli import cli; "
+            "cli(['validate', '--help'], standalone_mode=False)"
+        )
+
+    def test_schema(self):
+        self.assertNoHeavyImports(
+            "from fixtodict.cli import cli; cli(['schema'], standalone_mode=False)"
+        )
+
+    def test_convert(self):
+        self.assertNoHeavyImports(
+            "from xml.etree.ElementTree import fromstring; "
+            "from fixtodict.xml_logic import xml_to_fields; "
+            "xml_to_fields(fromstring("
+            "'<Fields><Field><Tag>10</Tag></Field><Field><Tag>2</Tag></Field>"
+            "</Fields>'))"
+        )
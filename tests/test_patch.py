@@ -0,0 +1,149 @@
+import copy
+import unittest
+import jsonpatch
+
+from fixtodict.patch import apply_patches_in_place, consolidate_patches
+
+DATA = {
+    "meta": {"version": {"fix": "fix", "ep": []}},
+    "fields": {"1": {"name": "Account", "enum": ["A", "B"]}, "2": {"name": "X"}},
+    "components": {"1001": {"name": "Instrument"}},
+}
+
+PATCHES = [
+    [
+        {"op": "replace", "path": "/fields/1/name", "value": "Acct"},
+        {"op": "add", "path": "/fields/1/enum/1", "value": "C"},
+        {"op": "add", "path": "/components/1002", "value": {"name": "Parties"}},
+        {"op": "add", "path": "/meta/version/ep/-", "value": "97"},
+    ],
+    [
+        {"op": "remove", "path": "/fields/2"},
+        {"op": "move", "from": "/fields/1/enum/0", "path": "/fields/1/first"},
+        {"op": "copy", "from": "/components/1001", "path": "/components/1003"},
+        {"op": "test", "path": "/fields/1/enum", "value": ["C", "B"]},
+    ],
+]
+
+
+class TestApplyPatchesInPlace(unittest.TestCase):
+    def test_same_as_jsonpatch(self):
+        expected = copy.deepcopy(DATA)
+        for ops in PATCHES:
+            expected = jsonpatch.JsonPatch(ops).apply(expected)
+        data = copy.deepcopy(DATA)
+        apply_patches_in_place(data, [jsonpatch.JsonPatch(ops) for ops in PATCHES])
+        self.assertEqual(data, expected)
+
+    def test_across_kinds(self):
+        data = copy.deepcopy(DATA)
+        ops = [
+            {"op": "move", "from": "/components/1001", "path": "/fields/1001"},
+            {"op": "replace", "path": "/fields/1001/name", "value": "Instr"},
+        ]
+        apply_patches_in_place(data, [ops])
+        self.assertEqual(data["fields"]["1001"], {"name": "Instr"})
+        self.assertEqual(data["components"], {})
+
+    def test_conflict(self):
+        data = copy.deepcopy(DATA)
+        with self.assertRaises(jsonpatch.JsonPatchConflict):
+            apply_patches_in_place(data, [[{"op": "remove", "path": "/fields/3"}]])
+
+    def test_failed_test(self):
+        data = copy.deepcopy(DATA)
+        ops = [{"op": "test", "path": "/fields/2/name", "value": "Y"}]
+        with self.assertRaises(jsonpatch.JsonPatchTestFailed):
+            apply_patches_in_place(data, [ops])
+
+
+EPS = [
+    [
+        {"op": "add", "path": "/fields/3", "value": {"name": "AdvId"}},
+        {"op": "replace", "path": "/fields/1/name", "value": "Acct"},
+        {"op": "add", "path": "/meta/version/ep/-", "value": "97"},
+    ],
+    [
+        {"op": "replace", "path": "/fields/3/name", "value": "AdvID"},
+        {"op": "add", "path": "/fields/3/docs", "value": {}},
+        {"op": "replace", "path": "/fields/1/name", "value": "Account"},
+        {"op": "replace", "path": "/components/1001/name", "value": "Instr"},
+        {"op": "add", "path": "/meta/version/ep/-", "value": "98"},
+    ],
+    [
+        {"op": "replace", "path": "/fields/1", "value": {"name": "Account"}},
+        {"op": "remove", "path": "/components/1001"},
+        {"op": "replace", "path": "/fields/2", "value": {"name": "Y"}},
+        {"op": "add", "path": "/fields/2", "value": {"name": "Z"}},
+        {"op": "add", "path": "/meta/version/ep/-", "value": "99"},
+    ],
+]
+
+
+class TestConsolidatePatches(unittest.TestCase):
+    def test_same_as_jsonpatch(self):
+        expected = copy.deepcopy(DATA)
+        for ops in EPS:
+            expected = jsonpatch.JsonPatch(ops).apply(expected)
+        ops = consolidate_patches(EPS, ["fields", "components"])
+        data = copy.deepcopy(DATA)
+        apply_patches_in_place(data, [ops])
+        self.assertEqual(data, expected)
+
+    def test_collapsed(self):
+        ops = consolidate_patches(EPS, ["fields", "components"])
+        self.assertEqual(
+            [(op["op"], op["path"]) for op in ops],
+            [
+                ("add", "/fields/3"),
+                ("add", "/meta/version/ep/-"),
+                ("add", "/meta/version/ep/-"),
+                ("replace", "/fields/1"),
+                ("remove", "/components/1001"),
+                ("add", "/fields/2"),
+                ("add", "/meta/version/ep/-"),
+            ],
+        )
+        self.assertEqual(ops[0]["value"], {"name": "AdvID", "docs": {}})
+        # Inputs are left untouched.
+        self.assertEqual(EPS[0][0]["value"], {"name": "AdvId"})
+
+    def test_barrier(self):
+        ops = [
+            {"op": "replace", "path": "/fields/1/name", "value": "A"},
+            {"op": "test", "path": "/fields/1/name", "value": "A"},
+            {"op": "replace", "path": "/fields/1/name", "value": "B"},
+        ]
+        self.assertEqual(consolidate_patches([ops], ["fields"]), ops)
+
+    def test_list_items(self):
+        eps = [
+            [
+                {"op": "add", "path": "/fields/1/enum/1", "value": "X"},
+                {"op": "replace", "path": "/fields/1/name", "value": "A"},
+            ],
+            [
+                {"op": "add", "path": "/fields/1/enum/1", "value": "Y"},
+                {"op": "replace", "path": "/fields/1/name", "value": "B"},
+            ],
+        ]
+        ops = consolidate_patches(eps, ["fields"])
+        self.assertEqual(ops, eps[0] + eps[1])
+        data = copy.deepcopy(DATA)
+        apply_patches_in_place(data, [ops])
+        self.assertEqual(data["fields"]["1"]["enum"], ["A", "Y", "X", "B"])
+
+    def test_top_level(self):
+        eps = [
+            [{"op": "replace", "path": "/fields/1/name", "value": "A"}],
+            [{"op": "replace", "path": "/fields", "value": {"1": {"name": "X"}}}],
+            [{"op": "replace", "path": "/fields/1/name", "value": "B"}],
+        ]
+        ops = consolidate_patches(eps, ["fields"])
+        self.assertEqual(ops, eps[0] + eps[1] + eps[2])
+        expected = copy.deepcopy(DATA)
+        for patch in eps:
+            expected = jsonpatch.JsonPatch(patch).apply(expected)
+        data = copy.deepcopy(DATA)
+        apply_patches_in_place(data, [ops])
+        self.assertEqual(data, expected)
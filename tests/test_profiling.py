@@ -0,0 +1,27 @@
+import unittest
+
+from fixtodict.profiling import Profiler, NULL_PROFILER
+
+
+class TestProfiler(unittest.TestCase):
+    def test_stages(self):
+        profiler = Profiler()
+        with profiler.stage("first", 3):
+            data = [str(i) for i in range(10000)]
+        with profiler.stage("second") as stage:
+            stage["count"] = len(data)
+        report = profiler.to_dict()
+        self.assertEqual([s["name"] for s in report["stages"]], ["first", "second"])
+        self.assertEqual([s["count"] for s in report["stages"]], [3, 10000])
+        self.assertGreater(report["stages"][0]["peak"], 0)
+        self.assertGreaterEqual(report["wall"], 0)
+
+    def test_without_memory(self):
+        profiler = Profiler(trace_memory=False)
+        with profiler.stage("only"):
+            pass
+        self.assertNotIn("peak", profiler.to_dict()["stages"][0])
+
+    def test_null(self):
+        with NULL_PROFILER.stage("ignored") as stage:
+            stage["count"] = 1
@@ -0,0 +1,84 @@
+import pickle
+import unittest
+from xml.etree.ElementTree import fromstring
+
+from fixtodict.fix_version import FixVersion
+from fixtodict.xml_logic import xml_to_enums, xml_to_msg_contents
+from fixtodict.xml_logic.records import EnumValue, records_to_dicts
+from fixtodict.xml_logic.utils import xml_get_history, xml_get_history_record
+
+ENUMS = """
+<Enums>
+  <Enum added="FIX.4.4" updated="FIX.5.0SP2" updatedEP="97">
+    <Tag>54</Tag><Value>1</Value><SymbolicName>Buy</SymbolicName>
+  </Enum>
+  <Enum added="FIX.4.4"><Tag>54</Tag><Value>2</Value></Enum>
+</Enums>
+"""
+
+MSG_CONTENTS = """
+<MsgContents>
+  <MsgContent added="FIX.4.4">
+    <ComponentID>1</ComponentID><TagText>55</TagText>
+    <Position>2</Position><Reqd>0</Reqd>
+  </MsgContent>
+  <MsgContent added="FIX.4.4">
+    <ComponentID>1</ComponentID><TagText>11</TagText>
+    <Position>1</Position><Reqd>1</Reqd>
+  </MsgContent>
+</MsgContents>
+"""
+
+
+class TestRecords(unittest.TestCase):
+    def test_enums(self):
+        enums = records_to_dicts(xml_to_enums(fromstring(ENUMS)))
+        self.assertEqual(
+            enums["54"][0],
+            {
+                "name": "Buy",
+                "value": "1",
+                "history": {
+                    "added": {"fix": "fix", "major": "4", "minor": "4", "sp": "0"},
+                    "updated": {
+                        "fix": "fix",
+                        "major": "5",
+                        "minor": "0",
+                        "sp": "2",
+                        "ep": "97",
+                    },
+                },
+                "docs": {},
+            },
+        )
+        self.assertEqual(list(enums["54"][1]), ["value", "history", "docs"])
+
+    def test_msg_contents(self):
+        msg_contents = records_to_dicts(xml_to_msg_contents(fromstring(MSG_CONTENTS)))
+        self.assertEqual([c["tag"] for c in msg_contents["1"]], ["11", "55"])
+        self.assertEqual(
+            list(msg_contents["1"][0]),
+            ["$parent", "tag", "kind", "position", "optional", "inlined", "docs", "history"],
+        )
+        self.assertIsNone(msg_contents["1"][0]["kind"])
+        self.assertEqual(msg_contents["1"][1]["optional"], True)
+
+    def test_pickle(self):
+        enums = xml_to_enums(fromstring(ENUMS))
+        self.assertEqual(
+            records_to_dicts(pickle.loads(pickle.dumps(enums))), records_to_dicts(enums)
+        )
+        self.assertIsInstance(enums["54"][0], EnumValue)
+
+    def test_interned_versions(self):
+        root = fromstring(ENUMS)
+        (a, b) = [xml_get_history_record(child) for child in root]
+        self.assertIs(a.added, b.added)
+        # Output doesn't share them, so it can be modified in place.
+        (a, b) = [xml_get_history(child) for child in root]
+        self.assertEqual(a["added"], b["added"])
+        self.assertIsNot(a["added"], b["added"])
+        self.assertIs(FixVersion("FIX.4.4").interned(), FixVersion("FIX.4.4").interned())
+        self.assertIsNot(
+            FixVersion("FIX.5.0SP2", "97").interned(), FixVersion("FIX.5.0SP2").interned()
+        )
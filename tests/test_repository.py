@@ -0,0 +1,23 @@
+import unittest
+from xml.etree.ElementTree import Element, fromstring
+
+from fixtodict.repository import transform_basic_repository_v1
+from tests.fixtures import FILES
+
+
+class TestRepository(unittest.TestCase):
+    def test_msg_content_kinds(self):
+        xml = {filename: fromstring(content) for (filename, content) in FILES.items()}
+        data = transform_basic_repository_v1(
+            Element("Abbreviations"),
+            Element("Categories"),
+            Element("Components"),
+            xml["Datatypes.xml"],
+            xml["Enums.xml"],
+            xml["Fields.xml"],
+            xml["Messages.xml"],
+            xml["MsgContents.xml"],
+            Element("Sections"),
+        )
+        contents = data["messages"]["D"]["contents"]
+        self.assertEqual([c["kind"] for c in contents], ["field", "field"])
@@ -0,0 +1,101 @@
+import unittest
+from unittest import mock
+
+import jsonpatch
+
+from fixtodict.schema import (
+    validator_v1,
+    iter_errors_v1,
+    iter_patched_errors_v1,
+    patched_entries,
+    error_pointer,
+)
+from tests.fixtures import basic_repository
+
+STRING = {"type": "string"}
+VERSION = {"fix": "fix", "major": "4", "minor": "4", "sp": "0"}
+
+
+def minimal_repository():
+    return {
+        "meta": {"schema": "1", "version": dict(VERSION)},
+        "abbreviations": {},
+        "datatypes": {},
+        "sections": {},
+        "categories": {},
+        "components": {},
+        "fields": {},
+        "messages": {},
+    }
+
+
+class TestSchema(unittest.TestCase):
+    def test_validator_is_cached(self):
+        self.assertIs(validator_v1(), validator_v1())
+
+    def test_valid(self):
+        self.assertEqual(list(iter_errors_v1(minimal_repository())), [])
+
+    def test_all_errors(self):
+        data = minimal_repository()
+        del data["fields"]
+        data["meta"]["version"] = 3
+        errors = list(iter_errors_v1(data))
+        self.assertEqual(
+            sorted(error_pointer(e) for e in errors), ["", "/meta/version"]
+        )
+
+
+    def test_escaped_pointer(self):
+        data = minimal_repository()
+        data["meta"]["version"] = {"a/b~c": 1}
+        entries = {"additionalProperties": STRING}
+        with mock.patch.dict(validator_v1().schema["definitions"]["version"], entries):
+            errors = list(iter_errors_v1(data))
+        self.assertIn("/meta/version/a~1b~0c", [error_pointer(e) for e in errors])
+
+
+class TestPatchedSchema(unittest.TestCase):
+    def test_entries(self):
+        patch = jsonpatch.JsonPatch(
+            [
+                {"op": "add", "path": "/fields/1", "value": {}},
+                {"op": "replace", "path": "/fields/1/name", "value": "Account"},
+                {"op": "move", "from": "/sections/a~1b", "path": "/sections/c"},
+            ]
+        )
+        self.assertEqual(
+            patched_entries(patch),
+            {("fields", "1"), ("sections", "a/b"), ("sections", "c")},
+        )
+
+    def test_meta_means_full(self):
+        patch = jsonpatch.JsonPatch(
+            [{"op": "add", "path": "/meta/version/ep", "value": "97"}]
+        )
+        self.assertIsNone(patched_entries(patch))
+
+    def test_only_patched_entries(self):
+        data = minimal_repository()
+        data["datatypes"]["Bad"] = {"base": 1}
+        patch = jsonpatch.JsonPatch(
+            [{"op": "add", "path": "/datatypes/Int", "value": {"base": 2}}]
+        )
+        data = patch.apply(data)
+        entries = {"additionalProperties": {"properties": {"base": STRING}}}
+        with mock.patch.dict(validator_v1().schema["properties"]["datatypes"], entries):
+            errors = list(iter_patched_errors_v1(data, patch))
+        self.assertEqual([error_pointer(e) for e in errors], ["/datatypes/Int/base"])
+
+    def test_same_as_full(self):
+        data = basic_repository()
+        self.assertEqual(list(iter_errors_v1(data)), [])
+        patch = jsonpatch.JsonPatch(
+            [
+                {"op": "replace", "path": "/datatypes/Length/base", "value": "Int"},
+                {"op": "replace", "path": "/fields/54/datatype", "value": "int"},
+                {"op": "remove", "path": "/messages/D/docs"},
+            ]
+        )
+        data = patch.apply(data)
+        self.assertEqual(list(iter_patched_errors_v1(data, patch)), [])
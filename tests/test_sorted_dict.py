@@ -0,0 +1,42 @@
+import unittest
+from xml.etree.ElementTree import fromstring
+
+from fixtodict.xml_logic.utils import natural_key, xml_to_sorted_dict
+
+
+def key_value(elem):
+    return (elem.get("id"), elem.get("value"))
+
+
+class TestSortedDict(unittest.TestCase):
+    def test_natural_order(self):
+        root = fromstring('<r><a id="10"/><a id="2"/><a id="M1"/><a id="1"/></r>')
+        self.assertEqual(
+            list(xml_to_sorted_dict(root, key_value)), ["1", "2", "10", "M1"]
+        )
+
+    def test_already_sorted(self):
+        root = fromstring('<r><a id="1"/><a id="2"/><a id="10"/></r>')
+        self.assertEqual(list(xml_to_sorted_dict(root, key_value)), ["1", "2", "10"])
+
+    def test_unsorted(self):
+        root = fromstring('<r><a id="10"/><a id="2"/></r>')
+        self.assertEqual(
+            list(xml_to_sorted_dict(root, key_value, sort=False)), ["10", "2"]
+        )
+
+    def test_duplicates(self):
+        # Values are never compared: the last one wins.
+        root = fromstring('<r><a id="1" value="b"/><a id="1" value="a"/></r>')
+        self.assertEqual(xml_to_sorted_dict(root, key_value), {"1": "a"})
+
+    def test_missing_root(self):
+        self.assertEqual(xml_to_sorted_dict(None, key_value), {})
+
+    def test_same_as_natsort(self):
+        from natsort import natsort_keygen
+
+        keys = ["", "1", "01", "10a", "a10b2", "AT_12", "x.y-1", "Ä1", None]
+        self.assertEqual(
+            [natural_key(k) for k in keys], [natsort_keygen()(k) for k in keys]
+        )
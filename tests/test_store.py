@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from fixtodict.store import Store, StoreError, write_store
+
+DATA = {
+    "meta": {"schema": "1", "version": {"fix": "fix", "major": "4", "minor": "4"}},
+    "abbreviations": {},
+    "fields": {
+        "35": {"name": "MsgType", "enum": [{"value": "0"}, {"value": "A"}]},
+        "a/b~c": {"name": "Escaped"},
+    },
+    "messages": {"D": {"name": "NewOrderSingle", "contents": []}},
+}
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "data.store")
+        with open(self.path, "wb") as f:
+            write_store(DATA, f)
+        self.store = Store(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_entries(self):
+        self.assertEqual(self.store.get("/fields/35"), DATA["fields"]["35"])
+        self.assertEqual(self.store.get("messages/D"), DATA["messages"]["D"])
+        self.assertEqual(self.store.entry("fields", "35"), DATA["fields"]["35"])
+        self.assertEqual(self.store.keys("fields"), ["35", "a/b~c"])
+
+    def test_inside_entries(self):
+        self.assertEqual(self.store.get("/fields/35/enum/1/value"), "A")
+        self.assertEqual(self.store.get("/meta/version/minor"), "4")
+        self.assertEqual(self.store.get("/fields/a~1b~0c/name"), "Escaped")
+
+    def test_whole_sections(self):
+        self.assertEqual(self.store.get("/fields"), DATA["fields"])
+        self.assertEqual(self.store.get("/abbreviations"), {})
+        self.assertEqual(self.store.get(""), DATA)
+        self.assertEqual(self.store.to_dict(), DATA)
+
+    def test_missing(self):
+        for pointer in ["/fields/36", "/fields/35/enum/2", "/fields/35/name/x"]:
+            with self.assertRaises(KeyError):
+                self.store.get(pointer)
+
+    def test_not_a_store(self):
+        for content in [b"", b'{"fields": {}}']:
+            path = os.path.join(self.tmp.name, "data.json")
+            with open(path, "wb") as f:
+                f.write(content)
+            with self.assertRaises(StoreError):
+                Store(path)
+
+    def test_corrupt(self):
+        with open(self.path, "rb") as f:
+            content = f.read()
+        path = os.path.join(self.tmp.name, "corrupt.store")
+        for corrupt in [
+            content[:-3],
+            content[: len(content) // 2],
+            content[:-12] + b"\xff\xfe\xfd\xfc" + content[-8:],
+            content[:-8] + b"\xff" * 8,
+        ]:
+            with open(path, "wb") as f:
+                f.write(corrupt)
+            with self.assertRaises(StoreError):
+                Store(path)
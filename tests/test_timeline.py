@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from fixtodict.fix_version import FixVersion
+from fixtodict.timeline import Timeline
+
+
+def repository(version, ep=None, fields=None):
+    version = FixVersion(version, ep)
+    return {"meta": {"version": dict(version.data)}, "fields": fields or {}}
+
+
+V44 = repository("FIX.4.4", fields={"1": {"name": "Account"}})
+V50 = repository(
+    "FIX.5.0",
+    fields={"1": {"name": "Account"}, "1300": {"name": "MarketSegmentID"}},
+)
+V50SP2 = repository(
+    "FIX.5.0SP2",
+    fields={
+        "1300": {"name": "MarketSegmentID", "history": {"updated": {}}},
+        "1301": {"name": "MarketID"},
+    },
+)
+V50SP2EP97 = repository(
+    "FIX.5.0SP2",
+    "97",
+    fields={"1300": {"name": "MarketSegmentId"}, "1301": {"name": "MarketID"}},
+)
+
+
+class TestTimeline(unittest.TestCase):
+    def events(self, timeline, key):
+        return [(str(v), event) for (v, event, _) in timeline.history("fields", key)]
+
+    def test_history(self):
+        timeline = Timeline()
+        for data in [V44, V50, V50SP2, V50SP2EP97]:
+            timeline.add(data)
+        self.assertEqual(
+            self.events(timeline, "1300"),
+            [("FIX.5.0", "added"), ("FIX.5.0SP2_EP97", "updated")],
+        )
+        self.assertEqual(
+            self.events(timeline, "1"),
+            [("FIX.4.4", "added"), ("FIX.5.0SP2", "removed")],
+        )
+        self.assertEqual(
+            [str(v) for v in timeline.versions_of("fields", "1301")],
+            ["FIX.5.0SP2", "FIX.5.0SP2_EP97"],
+        )
+        self.assertEqual(timeline.history("fields", "9999"), [])
+
+    def test_any_order(self):
+        in_order = Timeline()
+        for data in [V44, V50, V50SP2, V50SP2EP97]:
+            in_order.add(data)
+        shuffled = Timeline()
+        for data in [V50SP2EP97, V44, V50SP2, V50]:
+            shuffled.add(data)
+        self.assertEqual(shuffled.versions, in_order.versions)
+        self.assertEqual(shuffled.entries, in_order.entries)
+
+    def test_replace(self):
+        timeline = Timeline()
+        for data in [V44, V50, V50SP2]:
+            timeline.add(data)
+        timeline.add(repository("FIX.5.0", fields={"1": {"name": "Account"}}))
+        self.assertEqual(len(timeline.versions), 3)
+        self.assertEqual(self.events(timeline, "1300"), [("FIX.5.0SP2", "added")])
+
+    def test_save_and_load(self):
+        timeline = Timeline()
+        for data in [V44, V50SP2]:
+            timeline.add(data)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "timeline.json")
+            timeline.save(path)
+            loaded = Timeline.load(path)
+        loaded.add(V50)
+        timeline.add(V50)
+        self.assertEqual(loaded.versions, timeline.versions)
+        self.assertEqual(loaded.entries, timeline.entries)
@@ -0,0 +1,68 @@
+import copy
+import os
+import tempfile
+import unittest
+from xml.etree.ElementTree import fromstring
+
+from fixtodict.cli.utils.xml import stream_xml_root
+from fixtodict.unified_repository_v1 import iter_unified_repository_v1
+from fixtodict.xml_logic import xml_to_docs_definitions
+
+UNIFIED_XML = """<?xml version="1.0"?>
+<fixRepository version="1.0">
+  <fix version="FIX.4.4">
+    <abbreviations><abbreviation abbrTerm="Acct" textId="AT_Acct"/></abbreviations>
+    <fields><field id="1" name="Account" type="String" textId="FIELD_1"/></fields>
+  </fix>
+  <fix version="FIX.5.0SP2">
+    <abbreviations><abbreviation abbrTerm="Acct" textId="AT_Acct"/></abbreviations>
+    <fields>
+      <field id="1" name="Account" type="String" textId="FIELD_1"/>
+      <field id="55" name="Symbol" type="String" textId="FIELD_1"/>
+    </fields>
+  </fix>
+</fixRepository>
+"""
+
+PHRASES_XML = """
+<phrases>
+  <phrase textId="AT_Acct"><text purpose="SYNOPSIS"><para>Account</para></text></phrase>
+  <phrase textId="FIELD_1"><text purpose="SYNOPSIS"><para>Mnemonic.</para></text></phrase>
+</phrases>
+"""
+
+
+class TestIterUnifiedRepository(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.dir.name, "unified.xml"), "w") as f:
+            f.write(UNIFIED_XML)
+        self.phrases = xml_to_docs_definitions(fromstring(PHRASES_XML))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def fixes(self):
+        return stream_xml_root(self.dir.name, "unified.xml")
+
+    def test_all_versions(self):
+        phrases = copy.deepcopy(self.phrases)
+        datas = list(iter_unified_repository_v1(self.fixes(), phrases))
+        self.assertEqual(
+            [d["meta"]["version"]["major"] for d in datas], ["4", "5"]
+        )
+        for data in datas:
+            self.assertEqual(data["abbreviations"]["Acct"]["term"], "Account")
+            self.assertEqual(
+                data["fields"]["1"]["docs"]["description"], "Mnemonic.\n"
+            )
+        self.assertEqual(list(datas[1]["fields"]), ["1", "55"])
+        # Shared by all versions, so never modified.
+        self.assertEqual(phrases, self.phrases)
+
+    def test_some_versions(self):
+        datas = list(
+            iter_unified_repository_v1(self.fixes(), self.phrases, ["FIX.5.0SP2"])
+        )
+        self.assertEqual(len(datas), 1)
+        self.assertEqual(datas[0]["meta"]["version"]["sp"], "2")
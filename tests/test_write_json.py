@@ -0,0 +1,28 @@
+import io
+import json
+import unittest
+
+from fixtodict.cli.utils.json import write_json
+
+DATA = {
+    "meta": {"schema": "1", "version": {"fix": "fix", "major": "4", "minor": "4"}},
+    "abbreviations": {},
+    "fields": {
+        "1": {"name": "Account", "docs": {"description": "Multi\nline \"quoted\""}},
+        "55": {"name": "Symbol", "enum": [{"value": "A"}, {"value": "B"}]},
+    },
+    "messages": {"D": {"contents": []}},
+}
+
+
+class TestWriteJson(unittest.TestCase):
+    def test_indented(self):
+        f = io.StringIO()
+        write_json(DATA, f)
+        self.assertEqual(f.getvalue(), json.dumps(DATA, indent=2) + "\n")
+
+    def test_compact(self):
+        f = io.StringIO()
+        write_json(DATA, f, indent=None)
+        expected = json.dumps(DATA, separators=(",", ":")) + "\n"
+        self.assertEqual(f.getvalue(), expected)
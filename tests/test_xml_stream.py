@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from fixtodict.cli.utils.xml import read_xml_root, stream_xml_root
+from fixtodict.xml_logic import xml_to_fields
+
+FIELDS_XML = """<?xml version="1.0"?>
+<Fields xmlns="http://www.fixprotocol.org/ns/fix" version="FIX.4.4">
+    <Field added="FIX.2.7">
+        <Tag>1</Tag>
+        <Name>Account</Name>
+        <Type>String</Type>
+        <Description>Account mnemonic.</Description>
+    </Field>
+    <Field added="FIX.4.4" updated="FIX.5.0SP2" updatedEP="97">
+        <Tag>2841</Tag>
+        <Name>UnderlyingRefID</Name>
+        <Type>String</Type>
+        <Description>Identifies ...</Description>
+    </Field>
+</Fields>
+"""
+
+
+class TestXmlStream(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.dir.name, "Fields.xml"), "w") as f:
+            f.write(FIELDS_XML)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_root_attrs(self):
+        stream = stream_xml_root(self.dir.name, "Fields.xml")
+        self.assertEqual(stream.tag, "Fields")
+        self.assertEqual(stream.get("version"), "FIX.4.4")
+
+    def test_same_as_tree(self):
+        self.assertEqual(
+            xml_to_fields(stream_xml_root(self.dir.name, "Fields.xml")),
+            xml_to_fields(read_xml_root(self.dir.name, "Fields.xml")),
+        )
+
+    def test_missing_optional_file(self):
+        self.assertIsNone(stream_xml_root(self.dir.name, "Sections.xml"))